@@ -6,7 +6,9 @@ This will give us a comprehensive list of all available bank APIs for our Luke P
 
 import requests
 import json
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -18,6 +20,46 @@ from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import re
 
+# Bank domain references, with or without a scheme (covers both full URLs and
+# bare quoted domains such as "anz.com.au" inside JSON strings)
+DOMAIN_PATTERN = re.compile(
+    r'(?:https?://)?([a-z0-9.-]+\.(?:com\.au|com|net\.au|org\.au))',
+    re.IGNORECASE
+)
+
+# CDR product endpoints: scheme, banking term and "products" are all enforced
+# by the regex engine so non-candidates never become Python strings
+ENDPOINT_PATTERN = re.compile(
+    r'https?://[^\s"\'<>]*?'
+    r'(?:cds-au|banking|cdr)[^\s"\'<>]*?'
+    r'products[^\s"\'<>]*',
+    re.IGNORECASE
+)
+
+# Bank configuration key-value pairs, e.g. "anz": "https://.../api/..."
+BANK_ENDPOINT_PATTERN = re.compile(
+    r'["\'](\w+)["\']:\s*["\']([^"\']*api[^"\']*)["\']',
+    re.IGNORECASE
+)
+
+def scan_script(script_content):
+    """Run all regex scans over a single script body.
+    
+    Kept at module level so it can be pickled and run in a worker process;
+    results are merged into the extractor on the main process.
+    """
+    script_lower = script_content.lower()
+    results = {'endpoints': [], 'bank_endpoints': [], 'domains': []}
+    
+    if "dataSources" in script_content:
+        results['endpoints'] = ENDPOINT_PATTERN.findall(script_content)
+    if "endpoints" in script_lower:
+        results['bank_endpoints'] = BANK_ENDPOINT_PATTERN.findall(script_content)
+    if "api" in script_lower and "products" in script_lower:
+        results['domains'] = DOMAIN_PATTERN.findall(script_content)
+    
+    return results
+
 class CDSDataSourceExtractor:
     def __init__(self):
         self.setup_driver()
@@ -58,20 +100,26 @@ class CDSDataSourceExtractor:
             
             # Check for JavaScript variables containing data sources
             script_elements = self.driver.find_elements(By.TAG_NAME, "script")
+            script_bodies = [script.get_attribute("innerHTML") for script in script_elements]
+            script_bodies = [body for body in script_bodies if body]
+            
+            # Regex scanning over large JS bundles is CPU-bound, so scan each
+            # script in its own process and merge the matches here
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                scan_results = list(executor.map(scan_script, script_bodies, chunksize=4))
             
-            for script in script_elements:
-                script_content = script.get_attribute("innerHTML")
-                if script_content and "dataSources" in script_content:
+            for results in scan_results:
+                if results['endpoints']:
                     print("📜 Found dataSources in JavaScript!")
-                    self.extract_from_javascript(script_content)
+                    self.extract_from_javascript(results['endpoints'])
                     
-                if script_content and "endpoints" in script_content.lower():
+                if results['bank_endpoints']:
                     print("📜 Found endpoints in JavaScript!")
-                    self.extract_endpoints_from_javascript(script_content)
+                    self.extract_endpoints_from_javascript(results['bank_endpoints'])
                     
-                if script_content and "api" in script_content.lower() and "products" in script_content.lower():
+                if results['domains']:
                     print("📜 Found API products references!")
-                    self.extract_api_references(script_content)
+                    self.extract_api_references(results['domains'])
             
             # Also check the DOM for data source listings
             self.extract_from_dom()
@@ -84,78 +132,52 @@ class CDSDataSourceExtractor:
             
         return self.data_sources
     
-    def extract_from_javascript(self, script_content):
-        """Extract data sources from JavaScript content"""
+    def extract_from_javascript(self, matches):
+        """Extract data sources from ENDPOINT_PATTERN matches in JavaScript content"""
         try:
-            # Look for various patterns that might contain API endpoints
-            patterns = [
-                r'"([^"]*api[^"]*products[^"]*)"',  # API endpoints with "products"
-                r"'([^']*api[^']*products[^']*)'",   # Single quoted API endpoints
-                r'baseUrl:\s*["\']([^"\']+)["\']',   # baseUrl definitions
-                r'endpoint:\s*["\']([^"\']+)["\']',  # endpoint definitions
-                r'url:\s*["\']([^"\']+)["\']',       # url definitions
-            ]
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, script_content, re.IGNORECASE)
-                for match in matches:
-                    if self.is_valid_api_endpoint(match):
-                        print(f"✅ Found API endpoint: {match}")
-                        self.data_sources.append({
-                            'endpoint': match,
-                            'source': 'javascript_extraction'
-                        })
+            # The strict pattern already filtered candidates - only the "api"
+            # keyword is left for the validator to check
+            for match in matches:
+                if self.is_valid_api_endpoint(match):
+                    print(f"✅ Found API endpoint: {match}")
+                    self.data_sources.append({
+                        'endpoint': match,
+                        'source': 'javascript_extraction'
+                    })
                         
         except Exception as e:
             print(f"⚠️ Error parsing JavaScript: {e}")
     
-    def extract_endpoints_from_javascript(self, script_content):
-        """Extract specific endpoint configurations"""
+    def extract_endpoints_from_javascript(self, matches):
+        """Extract specific endpoint configurations from (bank_name, endpoint) matches"""
         try:
-            # Look for bank configurations
-            bank_patterns = [
-                r'(\w+):\s*{\s*[^}]*endpoint[^}]*}',  # Bank objects with endpoints
-                r'["\'](\w+)["\']:\s*["\']([^"\']*api[^"\']*)["\']',  # Key-value pairs
-            ]
-            
-            for pattern in bank_patterns:
-                matches = re.findall(pattern, script_content, re.IGNORECASE)
-                for match in matches:
-                    if isinstance(match, tuple) and len(match) == 2:
-                        bank_name, endpoint = match
-                        if self.is_valid_api_endpoint(endpoint):
-                            print(f"🏦 Found {bank_name}: {endpoint}")
-                            self.data_sources.append({
-                                'bank_name': bank_name,
-                                'endpoint': endpoint,
-                                'source': 'bank_configuration'
-                            })
+            for bank_name, endpoint in matches:
+                if self.is_valid_api_endpoint(endpoint):
+                    print(f"🏦 Found {bank_name}: {endpoint}")
+                    self.data_sources.append({
+                        'bank_name': bank_name,
+                        'endpoint': endpoint,
+                        'source': 'bank_configuration'
+                    })
                             
         except Exception as e:
             print(f"⚠️ Error parsing bank endpoints: {e}")
     
-    def extract_api_references(self, script_content):
-        """Extract API references and construct endpoints"""
+    def extract_api_references(self, matches):
+        """Construct endpoints from DOMAIN_PATTERN matches in JavaScript content"""
         try:
-            # Look for domain references that could be API bases
-            domain_patterns = [
-                r'https?://([^/]+\.(?:com\.au|com|net\.au|org\.au))[^"\'\s]*',
-                r'["\']([^"\']*\.(?:com\.au|com))["\']',
-            ]
-            
-            for pattern in domain_patterns:
-                matches = re.findall(pattern, script_content, re.IGNORECASE)
-                for match in matches:
-                    if self.looks_like_bank_domain(match):
-                        # Try to construct API endpoint
-                        api_endpoint = self.construct_api_endpoint(match)
-                        if api_endpoint:
-                            print(f"🔗 Constructed endpoint: {api_endpoint}")
-                            self.data_sources.append({
-                                'endpoint': api_endpoint,
-                                'domain': match,
-                                'source': 'domain_construction'
-                            })
+            # Domain references that could be API bases
+            for match in matches:
+                if self.looks_like_bank_domain(match):
+                    # Try to construct API endpoint
+                    api_endpoint = self.construct_api_endpoint(match)
+                    if api_endpoint:
+                        print(f"🔗 Constructed endpoint: {api_endpoint}")
+                        self.data_sources.append({
+                            'endpoint': api_endpoint,
+                            'domain': match,
+                            'source': 'domain_construction'
+                        })
                             
         except Exception as e:
             print(f"⚠️ Error extracting API references: {e}")
@@ -192,7 +214,13 @@ class CDSDataSourceExtractor:
             logs = self.driver.get_log('performance')
             
             for log in logs:
-                message = json.loads(log['message'])
+                # Cheap substring check first - most CDP events are Page.*/Runtime.*
+                # and don't need to be deserialized at all
+                raw_message = log['message']
+                if 'Network.responseReceived' not in raw_message:
+                    continue
+                
+                message = json.loads(raw_message)
                 if message['message']['method'] == 'Network.responseReceived':
                     url = message['message']['params']['response']['url']
                     if 'api' in url.lower() and 'products' in url.lower():
@@ -8,20 +8,40 @@ and exports to CSV format with all requested fields.
 
 import json
 import csv
+import gzip
+import io
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, asdict, astuple, replace
 import logging
 import re
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from selenium.webdriver.common.action_chains import ActionChains
+import sys
+import threading
+from pathlib import Path
+
+# Selenium is only needed for the demo page fallback - the CDR API path
+# runs without it
+try:
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.options import Options
+    from selenium.common.exceptions import TimeoutException, NoSuchElementException
+    from selenium.webdriver.common.action_chains import ActionChains
+except ImportError:
+    webdriver = None
+
+# lxml parses an already-fetched page source locally; without it the
+# script tags are read from the browser instead
+try:
+    import lxml.html
+except ImportError:
+    lxml = None
 
 # Configure logging
 logging.basicConfig(
@@ -30,7 +50,151 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Public CDR product endpoints for the data sources shown on the demo page
+CDS_PRODUCT_ENDPOINTS = {
+    'ANZ': 'https://api.anz/cds-au/v1/banking/products',
+    'CommBank': 'https://api.commbank.com.au/public/cds-au/v1/banking/products',
+    'NAB': 'https://openbank.api.nab.com.au/cds-au/v1/banking/products',
+    'Westpac': 'https://digital-api.westpac.com.au/cds-au/v1/banking/products'
+}
+
+# Concurrent CDR list and product detail requests, one pooled connection each
+API_WORKERS = 8
+
+# Results of a scrape are reused for a day so repeat runs skip the network
+PRODUCT_CACHE_PATH = Path('~/.cache/banking-tracker/products.json').expanduser()
+PRODUCT_CACHE_MAX_AGE = 24 * 60 * 60  # seconds
+
+# Default CSV exports above this many products are gzip-compressed
+GZIP_PRODUCT_THRESHOLD = 10000
+
+# Fields that only take a handful of distinct values across all products
+CATEGORICAL_FIELDS = ('data_source', 'loan_purpose', 'repayment_type', 'offset_available')
+
+# Sample products based on current market data - fields shared by every
+# sample product, then the per-bank differences
+SAMPLE_PRODUCT_DEFAULTS = {
+    'loan_purpose': "Both",
+    'repayment_type': "Both",
+    'offset_available': "Y",
+    'application_fee': "$600",
+    'annual_fee': "$395",
+    'monthly_fee': "$0",
+    'establishment_fee': "$600",
+    'exit_fee': "$0",
+    'other_fees': "Package fee $395 p.a.",
+    'features': "Offset Account | Redraw | Package Benefits",
+    'minimum_loan_amount': "$10,000",
+    'maximum_loan_amount': "No limit"
+}
+SAMPLE_PRODUCT_VARIANTS = [
+    {
+        'data_source': "ANZ",
+        'product_name': "ANZ Standard Variable",
+        'interest_rate': "6.24%",
+        'comparison_rate': "6.25%",
+        'annual_fee': "$0",
+        'other_fees': "No ongoing fees",
+        'features': "Offset Account | Redraw | Extra Repayments",
+        'description': "Flexible variable rate home loan with offset account",
+        'maximum_loan_amount': "$3,000,000",
+        'application_url': "https://www.anz.com.au/personal/home-loans/"
+    },
+    {
+        'data_source': "CommBank",
+        'product_name': "Wealth Package",
+        'interest_rate': "6.19%",
+        'comparison_rate': "6.20%",
+        'description': "Premium home loan package with offset and benefits",
+        'application_url': "https://www.commbank.com.au/home-loans/"
+    },
+    {
+        'data_source': "NAB",
+        'product_name': "NAB Choice Package",
+        'interest_rate': "6.29%",
+        'comparison_rate': "6.31%",
+        'description': "Comprehensive home loan package with multiple benefits",
+        'application_url': "https://www.nab.com.au/personal/home-loans/"
+    },
+    {
+        'data_source': "Westpac",
+        'product_name': "Premier Advantage Package",
+        'interest_rate': "6.39%",
+        'comparison_rate': "6.40%",
+        'description': "Premium banking package with home loan benefits",
+        'application_url': "https://www.westpac.com.au/personal-banking/home-loans/"
+    }
+]
+
+# Patterns used on every scraped container/console line - compiled once
+RATE_PATTERN = re.compile(r'(\d+\.\d+)%')
+RESIDENTIAL_JSON_PATTERN = re.compile(r'\{[^{}]*"RESIDENTIAL_MORTGAGES"[^{}]*\}')
+BANK_PATTERN = re.compile('|'.join(map(re.escape, CDS_PRODUCT_ENDPOINTS)), re.IGNORECASE)
+BANK_NAMES_BY_LOWER = {bank.lower(): bank for bank in CDS_PRODUCT_ENDPOINTS}
+
+# Product keywords as bit flags so parse_product_from_text needs a single
+# scan of the text. Product-name keywords are case-sensitive, the rest are not.
+(KW_VARIABLE, KW_FIXED, KW_STANDARD, KW_INVESTMENT, KW_OWNER_OCCUPIER, KW_INTEREST_ONLY,
+ KW_OFFSET, KW_REDRAW, KW_EXTRA_REPAYMENT, KW_FLEXIBLE, KW_SPLIT) = (1 << i for i in range(11))
+KEYWORD_FLAGS = {
+    'Variable': KW_VARIABLE,
+    'Fixed': KW_FIXED,
+    'Standard': KW_STANDARD,
+    'investment': KW_INVESTMENT,
+    'owner occupier': KW_OWNER_OCCUPIER,
+    'interest only': KW_INTEREST_ONLY,
+    'offset': KW_OFFSET,
+    'redraw': KW_REDRAW,
+    'extra repayment': KW_EXTRA_REPAYMENT,
+    'flexible': KW_FLEXIBLE,
+    'split': KW_SPLIT
+}
+# Rates and keywords share one alternation so the text is scanned once;
+# match.lastgroup tells the two apart. The case-insensitive keywords are
+# ASCII-only, like the str.lower() checks they replace, so Unicode case
+# folds such as 'ſ' never match and every keyword lowers to a dict key.
+PRODUCT_TEXT_PATTERN = re.compile(
+    r'(?P<rate>\d+\.\d+)%|'
+    r'(?P<keyword>Variable|Fixed|Standard|'
+    r'(?ai:investment|owner occupier|interest only|offset|redraw|extra repayment|flexible|split))'
+)
+FEATURE_FLAGS = [
+    (KW_OFFSET, 'Offset'),
+    (KW_REDRAW, 'Redraw'),
+    (KW_EXTRA_REPAYMENT, 'Extra Repayment'),
+    (KW_FLEXIBLE, 'Flexible'),
+    (KW_SPLIT, 'Split')
+]
+
+# Returns innerText of elements matching a CSS selector whose own text nodes
+# match a regex - replaces XPath contains(text(), ...) locators and the
+# per-element .text round-trips with a single execute_script call. With a
+# pattern, the DOM is walked once over text nodes only and each matching
+# parent element is reported once. An optional limit stops the walk early so
+# only that many results cross the WebDriver boundary, and count_only returns
+# just the number of matches instead of their text.
+ELEMENT_TEXTS_SCRIPT = """
+const selector = arguments[0];
+const limit = arguments[2] || Infinity;
+const countOnly = arguments[3];
+if (!arguments[1]) {
+    const matches = [...document.querySelectorAll(selector)].slice(0, limit);
+    return countOnly ? matches.length : matches.map(e => e.innerText);
+}
+const pattern = new RegExp(arguments[1]);
+const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+const elements = new Set();
+let node;
+while (elements.size < limit && (node = walker.nextNode())) {
+    const parent = node.parentElement;
+    if (parent && !elements.has(parent) && pattern.test(node.nodeValue) && parent.matches(selector)) {
+        elements.add(parent);
+    }
+}
+return countOnly ? elements.size : [...elements].map(e => e.innerText);
+"""
+
+@dataclass(slots=True, frozen=True)
 class ComprehensiveHomeLoan:
     """Final comprehensive data structure for home loan products"""
     data_source: str  # Bank name
@@ -55,19 +219,137 @@ class ComprehensiveHomeLoan:
 class ComprehensiveHomeLoanScraper:
     """Comprehensive scraper for the CDS Product Comparator Demo"""
     
-    def __init__(self):
+    def __init__(self, debug: bool = False):
         self.base_url = "https://consumerdatastandardsaustralia.github.io/product-comparator-demo/"
         self.driver = None
         self.all_products = []
+        self.debug = debug
+        self.debug_page_source_path = Path('/Users/piyushpillai/Desktop/fhl ob/debug_page_source.html')
         
         # Known data sources from the website
         self.data_sources = ['ANZ', 'CommBank', 'NAB', 'Westpac']
+        self.data_source_set = frozenset(self.data_sources)
+        
+        # Whether the last API extraction got any rate from a detail record
+        self.api_rates_found = False
+        
+        # One pooled session shared by all bank fetch threads
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=len(self.data_sources), pool_maxsize=API_WORKERS)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'x-v': '3'
+        })
+    
+    def fetch_bank_products(self, bank_name: str) -> List[Dict[str, Any]]:
+        """Fetch the residential mortgage list for one bank directly from its CDR API"""
+        try:
+            response = self.session.get(
+                CDS_PRODUCT_ENDPOINTS[bank_name],
+                params={'product-category': 'RESIDENTIAL_MORTGAGES', 'page-size': 100},
+                timeout=30
+            )
+            
+            if response.status_code == 200:
+                api_products = response.json().get('data', {}).get('products', [])
+                logger.info(f"Retrieved {len(api_products)} products from {bank_name} API")
+                return api_products
+            
+            logger.warning(f"Failed to fetch from {bank_name} API: {response.status_code}")
+                
+        except Exception as e:
+            logger.warning(f"Error fetching products from {bank_name} API: {e}")
+        
+        return []
+    
+    def fetch_product_detail(self, bank_name: str, api_product: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch a product's detail record, which carries its lending rates
+        
+        Falls back to the list entry if the detail request fails.
+        """
+        detail_url = f"{CDS_PRODUCT_ENDPOINTS[bank_name]}/{api_product.get('productId', '')}"
+        try:
+            response = self.session.get(detail_url, timeout=30)
+            if response.status_code == 200:
+                return response.json().get('data') or api_product
+            logger.warning(f"Failed to fetch {bank_name} product details: {response.status_code}")
+        except Exception as e:
+            logger.warning(f"Error fetching {bank_name} product details: {e}")
+        return api_product
+    
+    def extract_products_from_api(self) -> List[ComprehensiveHomeLoan]:
+        """Extract home loan data straight from the CDR APIs - no browser required
+        
+        The products list carries no rates, so each product's detail record
+        is fetched on the same pool as soon as its bank's list arrives.
+        """
+        products = []
+        
+        # Each bank and detail fetch is independent I/O, so run them concurrently
+        with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+            detail_futures = [
+                (bank_name, executor.submit(self.fetch_product_detail, bank_name, api_product))
+                for bank_name, api_products in zip(self.data_sources, executor.map(self.fetch_bank_products, self.data_sources))
+                for api_product in api_products
+            ]
+            details = [(bank_name, future.result()) for bank_name, future in detail_futures]
+        
+        self.api_rates_found = any(
+            lending_rate.get('rate') for _, detail in details for lending_rate in detail.get('lendingRates', [])
+        )
+        for bank_name, detail in details:
+            product = self.product_from_api_data(detail, bank_name)
+            if product:
+                products.append(product)
+        
+        logger.info(f"Total products extracted from CDR APIs: {len(products)}")
+        return products
+    
+    def product_from_api_data(self, api_product: Dict[str, Any], bank_name: str) -> Optional[ComprehensiveHomeLoan]:
+        """Convert a CDR product JSON object to a ComprehensiveHomeLoan"""
+        name = api_product.get('name', '')
+        description = api_product.get('description', '')
+        
+        # Purpose/repayment/offset/features come from the same keyword rules
+        # used for scraped text
+        product = self.parse_product_from_text(f"{name}\n{description}", bank_name)
+        if not product:
+            return None
+        
+        # Rates are only present on product detail records
+        interest_rate = ''
+        comparison_rate = ''
+        for lending_rate in api_product.get('lendingRates', []):
+            try:
+                if not interest_rate and lending_rate.get('rate'):
+                    interest_rate = f"{float(lending_rate['rate']) * 100:.2f}%"
+                if not comparison_rate and lending_rate.get('comparisonRate'):
+                    comparison_rate = f"{float(lending_rate['comparisonRate']) * 100:.2f}%"
+            except (TypeError, ValueError):
+                continue
+        
+        return replace(
+            product,
+            product_name=name or product.product_name,
+            interest_rate=interest_rate or product.interest_rate,
+            comparison_rate=comparison_rate,
+            description=description[:200] + "..." if len(description) > 200 else description,
+            application_url=api_product.get('applicationUri', '')
+        )
     
     def setup_driver(self):
         """Setup Chrome WebDriver with optimal settings"""
         options = Options()
-        # Don't use headless for better reliability with dynamic content
-        # options.add_argument("--headless")  
+        # New headless mode renders dynamic content like a headed browser
+        options.add_argument("--headless=new")
+        # Only text and JSON are read, so don't wait for or fetch subresources
+        options.page_load_strategy = "eager"
+        options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "permissions.default.stylesheet": 2
+        })
+        options.add_argument("--blink-settings=imagesEnabled=false")
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
@@ -111,7 +393,8 @@ class ComprehensiveHomeLoanScraper:
             
             # Wait for console output to appear
             WebDriverWait(self.driver, 30).until(
-                lambda driver: len(driver.find_elements(By.XPATH, "//*[contains(text(), 'products') or contains(text(), 'RESIDENTIAL')]")) > 0
+                lambda driver: driver.execute_script(
+                    "return /products|RESIDENTIAL/.test(document.body.innerText);")
             )
             
             # Additional wait for all data to load
@@ -121,20 +404,33 @@ class ComprehensiveHomeLoanScraper:
         except TimeoutException:
             logger.warning("Timeout waiting for data, proceeding anyway...")
     
+    def get_element_texts(self, selector: str, pattern: str = None, limit: int = None) -> List[str]:
+        """Get the text of (at most limit) matching elements in one WebDriver round-trip"""
+        return self.driver.execute_script(ELEMENT_TEXTS_SCRIPT, selector, pattern, limit) or []
+    
+    def count_elements(self, selector: str, pattern: str = None) -> int:
+        """Count matching elements without transferring their text"""
+        return self.driver.execute_script(ELEMENT_TEXTS_SCRIPT, selector, pattern, None, True) or 0
+    
     def extract_all_product_data(self) -> List[ComprehensiveHomeLoan]:
         """Extract all home loan data from the loaded page"""
         all_products = []
         
         try:
-            # Get all text content from the page
-            page_source = self.driver.page_source
-            
-            # Save page source for debugging
-            with open('/Users/piyushpillai/Desktop/fhl ob/debug_page_source.html', 'w', encoding='utf-8') as f:
-                f.write(page_source)
+            # Save page source for debugging - written in the background so
+            # the multi-MB dump doesn't block extraction
+            page_source = None
+            if self.debug:
+                page_source = self.driver.page_source
+                threading.Thread(
+                    target=self.debug_page_source_path.write_text,
+                    args=(page_source,),
+                    kwargs={'encoding': 'utf-8'},
+                    daemon=True
+                ).start()
             
             # Look for JSON data in script tags or data elements
-            products_found = self.extract_products_from_page_content()
+            products_found = self.extract_products_from_page_content(page_source)
             
             if not products_found:
                 # Fallback: try to interact with the page elements
@@ -149,24 +445,31 @@ class ComprehensiveHomeLoanScraper:
         
         return all_products
     
-    def extract_products_from_page_content(self) -> List[ComprehensiveHomeLoan]:
-        """Extract products from page content and JSON data"""
+    def extract_products_from_page_content(self, page_source: Optional[str] = None) -> List[ComprehensiveHomeLoan]:
+        """Extract products from page content and JSON data
+        
+        If the page source has already been fetched it is parsed locally
+        instead of serializing the DOM a second time.
+        """
         products = []
         
         try:
             # Look for JSON data in script tags
-            script_elements = self.driver.find_elements(By.TAG_NAME, "script")
-            
-            for script in script_elements:
-                try:
-                    script_content = script.get_attribute('innerHTML')
-                    if script_content and 'RESIDENTIAL' in script_content:
-                        # Try to extract JSON data
-                        json_matches = re.findall(r'\{[^{}]*"RESIDENTIAL_MORTGAGES"[^{}]*\}', script_content)
-                        for match in json_matches:
-                            logger.info(f"Found potential JSON data: {match[:200]}...")
-                except:
-                    continue
+            if page_source and lxml:
+                tree = lxml.html.fromstring(page_source)
+                script_contents = tree.xpath('//script[contains(text(), "RESIDENTIAL")]/text()')
+            else:
+                # Fetch every relevant script body in one round-trip rather
+                # than one call per <script>
+                script_contents = self.driver.execute_script(
+                    "return [...document.scripts].map(s => s.textContent)"
+                    ".filter(t => t && t.indexOf('RESIDENTIAL') >= 0);") or []
+            
+            for script_content in script_contents:
+                # Try to extract JSON data
+                json_matches = RESIDENTIAL_JSON_PATTERN.findall(script_content)
+                for match in json_matches:
+                    logger.info(f"Found potential JSON data: {match[:200]}...")
             
             # Look for displayed product information
             products.extend(self.extract_displayed_products())
@@ -182,19 +485,18 @@ class ComprehensiveHomeLoanScraper:
         
         try:
             # Look for product containers or tables
-            product_containers = self.driver.find_elements(By.XPATH, 
-                "//*[contains(text(), 'RESIDENTIAL') or contains(text(), 'mortgage') or contains(text(), 'home loan')]")
+            # Only the first 10 containers are processed, so stop looking there
+            product_containers = self.get_element_texts('body *', 'RESIDENTIAL|mortgage|home loan', limit=10)
             
-            logger.info(f"Found {len(product_containers)} potential product containers")
+            logger.info(f"Found {len(product_containers)} potential product containers (max 10)")
             
             # Try to find rate information
-            rate_elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), '%')]")
-            logger.info(f"Found {len(rate_elements)} elements containing '%'")
+            rate_element_count = self.count_elements('body *', '%')
+            logger.info(f"Found {rate_element_count} elements containing '%'")
             
             # Try to find structured data
-            for i, container in enumerate(product_containers[:10]):  # Process first 10
+            for i, container_text in enumerate(product_containers):
                 try:
-                    container_text = container.text
                     if len(container_text) > 20:  # Skip empty or very short elements
                         logger.info(f"Container {i}: {container_text[:100]}...")
                         
@@ -218,8 +520,9 @@ class ComprehensiveHomeLoanScraper:
         
         try:
             # Look for buttons or tabs for each bank
-            bank_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(text(), 'ANZ') or contains(text(), 'CommBank') or contains(text(), 'NAB') or contains(text(), 'Westpac')]")
+            bank_buttons = self.driver.execute_script(
+                "return [...document.querySelectorAll('button')]"
+                ".filter(b => /ANZ|CommBank|NAB|Westpac/.test(b.textContent));") or []
             
             if bank_buttons:
                 logger.info(f"Found {len(bank_buttons)} bank buttons/tabs")
@@ -227,7 +530,7 @@ class ComprehensiveHomeLoanScraper:
                 for button in bank_buttons:
                     try:
                         bank_name = button.text.strip()
-                        if bank_name in self.data_sources:
+                        if bank_name in self.data_source_set:
                             logger.info(f"Clicking on {bank_name}")
                             self.driver.execute_script("arguments[0].click();", button)
                             time.sleep(3)
@@ -241,12 +544,10 @@ class ComprehensiveHomeLoanScraper:
                         continue
             
             # Also try to find and parse any console output or JSON displays
-            console_elements = self.driver.find_elements(By.XPATH, 
-                "//*[contains(@class, 'console') or contains(@class, 'output') or contains(@class, 'json')]")
+            console_texts = self.get_element_texts("[class*='console'], [class*='output'], [class*='json']")
             
-            for element in console_elements:
+            for text_content in console_texts:
                 try:
-                    text_content = element.text
                     if 'RESIDENTIAL' in text_content or 'mortgage' in text_content.lower():
                         logger.info(f"Found console content: {text_content[:200]}...")
                         # Try to parse this content
@@ -269,12 +570,10 @@ class ComprehensiveHomeLoanScraper:
             time.sleep(2)
             
             # Look for product information in the current view
-            product_elements = self.driver.find_elements(By.XPATH, 
-                "//*[contains(text(), 'RESIDENTIAL') or contains(text(), 'Variable') or contains(text(), 'Fixed')]")
+            product_texts = self.get_element_texts('body *', 'RESIDENTIAL|Variable|Fixed')
             
-            for element in product_elements:
+            for element_text in product_texts:
                 try:
-                    element_text = element.text
                     if len(element_text) > 10:
                         product = self.parse_product_from_text(element_text, bank_name)
                         if product:
@@ -296,26 +595,42 @@ class ComprehensiveHomeLoanScraper:
         try:
             # Look for JSON-like structures in the text
             if 'RESIDENTIAL_MORTGAGES' in text_content:
-                # Try to extract product information
-                lines = text_content.split('\n')
+                # The console usually shows the raw API payload - when it
+                # parses as JSON, map the products directly
+                try:
+                    payload = json.loads(text_content)
+                except ValueError:
+                    payload = None
+                
+                if isinstance(payload, dict):
+                    for api_product in payload.get('data', {}).get('products', []):
+                        brand_match = BANK_PATTERN.search(api_product.get('brandName') or api_product.get('brand') or '')
+                        bank_name = BANK_NAMES_BY_LOWER[brand_match.group().lower()] if brand_match else "Unknown"
+                        product = self.product_from_api_data(api_product, bank_name)
+                        if product:
+                            products.append(product)
+                    return products
+                
+                # Otherwise scan the text line by line without materializing
+                # a list of all lines
                 current_product = {}
                 current_bank = "Unknown"
                 
-                for line in lines:
+                for line in io.StringIO(text_content):
                     line = line.strip()
                     
-                    # Look for bank indicators
-                    for bank in self.data_sources:
-                        if bank.lower() in line.lower():
-                            current_bank = bank
-                            break
+                    # Look for bank indicators (single scan for all banks)
+                    bank_match = BANK_PATTERN.search(line)
+                    if bank_match:
+                        current_bank = BANK_NAMES_BY_LOWER[bank_match.group().lower()]
                     
-                    # Look for product names
-                    if 'name' in line.lower() and ':' in line:
+                    # Look for product names (only lowercase lines that could be
+                    # a "name: value" pair)
+                    if ':' in line and 'name' in line.lower():
                         current_product['name'] = line.split(':')[-1].strip().strip('"')
                     
                     # Look for rates
-                    rate_match = re.search(r'(\d+\.\d+)%', line)
+                    rate_match = RATE_PATTERN.search(line)
                     if rate_match:
                         current_product['rate'] = f"{rate_match.group(1)}%"
                     
@@ -352,13 +667,25 @@ class ComprehensiveHomeLoanScraper:
     def parse_product_from_text(self, text: str, bank_name: str) -> Optional[ComprehensiveHomeLoan]:
         """Parse product information from text content"""
         try:
+            # One pass over the text picks up the first rate and collects
+            # every keyword as a bit flag
+            flags = 0
+            interest_rate = ""
+            for match in PRODUCT_TEXT_PATTERN.finditer(text):
+                if match.lastgroup == 'rate':
+                    if not interest_rate:
+                        interest_rate = f"{match.group('rate')}%"
+                else:
+                    keyword = match.group('keyword')
+                    flags |= KEYWORD_FLAGS.get(keyword) or KEYWORD_FLAGS[keyword.lower()]
+            
             # Extract product name
             product_name = ""
-            if 'Variable' in text:
+            if flags & KW_VARIABLE:
                 product_name = "Variable Rate Home Loan"
-            elif 'Fixed' in text:
+            elif flags & KW_FIXED:
                 product_name = "Fixed Rate Home Loan"
-            elif 'Standard' in text:
+            elif flags & KW_STANDARD:
                 product_name = "Standard Home Loan"
             else:
                 # Try to extract from the first meaningful line
@@ -366,36 +693,26 @@ class ComprehensiveHomeLoanScraper:
                 if lines:
                     product_name = lines[0][:50]  # First 50 chars
             
-            # Extract interest rate
-            interest_rate = ""
-            rate_matches = re.findall(r'(\d+\.\d+)%', text)
-            if rate_matches:
-                interest_rate = f"{rate_matches[0]}%"
-            
             # Determine loan purpose and repayment type from text
             loan_purpose = "Both"  # Default
             repayment_type = "Principal and Interest"  # Default
             
-            if 'investment' in text.lower():
+            if flags & KW_INVESTMENT:
                 loan_purpose = "Investment"
-            elif 'owner occupier' in text.lower():
+            elif flags & KW_OWNER_OCCUPIER:
                 loan_purpose = "Owner Occupier"
             
-            if 'interest only' in text.lower():
+            if flags & KW_INTEREST_ONLY:
                 repayment_type = "Interest Only"
             
             # Check for offset
-            offset_available = "Y" if 'offset' in text.lower() else "N"
+            offset_available = "Y" if flags & KW_OFFSET else "N"
             
             # Extract features
-            features = []
-            feature_keywords = ['offset', 'redraw', 'extra repayment', 'flexible', 'split']
-            for keyword in feature_keywords:
-                if keyword in text.lower():
-                    features.append(keyword.title())
+            features = [feature for flag, feature in FEATURE_FLAGS if flags & flag]
             
             return ComprehensiveHomeLoan(
-                data_source=bank_name,
+                data_source=sys.intern(bank_name),
                 product_name=product_name,
                 interest_rate=interest_rate,
                 comparison_rate='',  # Will be filled if available
@@ -422,102 +739,76 @@ class ComprehensiveHomeLoanScraper:
     def create_sample_data(self) -> List[ComprehensiveHomeLoan]:
         """Create sample data based on known Australian bank products"""
         sample_products = [
-            ComprehensiveHomeLoan(
-                data_source="ANZ",
-                product_name="ANZ Standard Variable",
-                interest_rate="6.24%",
-                comparison_rate="6.25%",
-                loan_purpose="Both",
-                repayment_type="Both",
-                offset_available="Y",
-                application_fee="$600",
-                annual_fee="$0",
-                monthly_fee="$0",
-                establishment_fee="$600",
-                exit_fee="$0",
-                other_fees="No ongoing fees",
-                features="Offset Account | Redraw | Extra Repayments",
-                description="Flexible variable rate home loan with offset account",
-                minimum_loan_amount="$10,000",
-                maximum_loan_amount="$3,000,000",
-                application_url="https://www.anz.com.au/personal/home-loans/"
-            ),
-            ComprehensiveHomeLoan(
-                data_source="CommBank",
-                product_name="Wealth Package",
-                interest_rate="6.19%",
-                comparison_rate="6.20%",
-                loan_purpose="Both",
-                repayment_type="Both",
-                offset_available="Y",
-                application_fee="$600",
-                annual_fee="$395",
-                monthly_fee="$0",
-                establishment_fee="$600",
-                exit_fee="$0",
-                other_fees="Package fee $395 p.a.",
-                features="Offset Account | Redraw | Package Benefits",
-                description="Premium home loan package with offset and benefits",
-                minimum_loan_amount="$10,000",
-                maximum_loan_amount="No limit",
-                application_url="https://www.commbank.com.au/home-loans/"
-            ),
-            ComprehensiveHomeLoan(
-                data_source="NAB",
-                product_name="NAB Choice Package",
-                interest_rate="6.29%",
-                comparison_rate="6.31%",
-                loan_purpose="Both",
-                repayment_type="Both",
-                offset_available="Y",
-                application_fee="$600",
-                annual_fee="$395",
-                monthly_fee="$0",
-                establishment_fee="$600",
-                exit_fee="$0",
-                other_fees="Package fee $395 p.a.",
-                features="Offset Account | Redraw | Package Benefits",
-                description="Comprehensive home loan package with multiple benefits",
-                minimum_loan_amount="$10,000",
-                maximum_loan_amount="No limit",
-                application_url="https://www.nab.com.au/personal/home-loans/"
-            ),
-            ComprehensiveHomeLoan(
-                data_source="Westpac",
-                product_name="Premier Advantage Package",
-                interest_rate="6.39%",
-                comparison_rate="6.40%",
-                loan_purpose="Both",
-                repayment_type="Both",
-                offset_available="Y",
-                application_fee="$600",
-                annual_fee="$395",
-                monthly_fee="$0",
-                establishment_fee="$600",
-                exit_fee="$0",
-                other_fees="Package fee $395 p.a.",
-                features="Offset Account | Redraw | Package Benefits",
-                description="Premium banking package with home loan benefits",
-                minimum_loan_amount="$10,000",
-                maximum_loan_amount="No limit",
-                application_url="https://www.westpac.com.au/personal-banking/home-loans/"
-            )
+            ComprehensiveHomeLoan(**{**SAMPLE_PRODUCT_DEFAULTS, **variant})
+            for variant in SAMPLE_PRODUCT_VARIANTS
         ]
         
         logger.info(f"Created {len(sample_products)} sample products based on current market data")
         return sample_products
     
-    def scrape_comprehensive_data(self) -> List[ComprehensiveHomeLoan]:
-        """Main method to scrape comprehensive home loan data"""
+    def load_cached_products(self, max_age: Optional[float] = PRODUCT_CACHE_MAX_AGE) -> Optional[List[ComprehensiveHomeLoan]]:
+        """Load products from the on-disk cache if it exists and is fresh enough"""
         try:
-            self.setup_driver()
-            self.load_cds_demo_page()
-            self.wait_for_data_to_load()
+            if not PRODUCT_CACHE_PATH.exists():
+                return None
+            
+            if max_age is not None and time.time() - PRODUCT_CACHE_PATH.stat().st_mtime > max_age:
+                return None
+            
+            cached = json.loads(PRODUCT_CACHE_PATH.read_text(encoding='utf-8'))
+            # json.loads creates a new string per row - intern the
+            # categorical fields so every product shares one copy
+            for data in cached:
+                for field in CATEGORICAL_FIELDS:
+                    data[field] = sys.intern(data[field])
+            products = [ComprehensiveHomeLoan(**data) for data in cached]
+            logger.info(f"Loaded {len(products)} products from cache {PRODUCT_CACHE_PATH}")
+            return products
             
-            # Try to extract actual data from the page
-            products = self.extract_all_product_data()
+        except Exception as e:
+            logger.warning(f"Error reading product cache: {e}")
+            return None
+    
+    def save_cached_products(self, products: List[ComprehensiveHomeLoan]):
+        """Write products to the on-disk cache"""
+        try:
+            PRODUCT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            PRODUCT_CACHE_PATH.write_text(json.dumps([asdict(p) for p in products]), encoding='utf-8')
+        except Exception as e:
+            logger.warning(f"Error writing product cache: {e}")
+    
+    def scrape_comprehensive_data(self, use_live: bool = True) -> List[ComprehensiveHomeLoan]:
+        """Main method to scrape comprehensive home loan data
+        
+        Products scraped in the last 24 hours are reused from the on-disk
+        cache. With use_live=False no network calls are made at all - any
+        cached products are used, otherwise sample data.
+        """
+        cached_products = self.load_cached_products(max_age=PRODUCT_CACHE_MAX_AGE if use_live else None)
+        if cached_products:
+            self.all_products = cached_products
+            return self.all_products
+        
+        if not use_live:
+            self.all_products = self.create_sample_data()
+            return self.all_products
+        
+        try:
+            # Call the CDR APIs directly first - no browser startup or sleeps
+            products = self.extract_products_from_api()
+            
+            # Only fall back to rendering the demo page if the APIs gave us little
+            if len(products) < 4 and webdriver is None:
+                logger.warning("Limited data from CDR APIs and Selenium is not installed, skipping demo page")
+            elif len(products) < 4:
+                logger.info("Limited data from CDR APIs, falling back to the demo page...")
+                self.setup_driver()
+                self.load_cds_demo_page()
+                self.wait_for_data_to_load()
+                products.extend(self.extract_all_product_data())
             
             # If we didn't get much data, supplement with sample data
+            sample_products = []
             if len(products) < 4:
                 logger.info("Limited data extracted from live site, supplementing with sample data...")
                 sample_products = self.create_sample_data()
@@ -525,6 +816,12 @@ class ComprehensiveHomeLoanScraper:
             
             self.all_products = products
             logger.info(f"Total comprehensive products: {len(products)}")
+            # Only cache runs with real API rates - never sample data or
+            # rate-less results, or a bad run would be served for a day
+            if not sample_products and self.api_rates_found:
+                self.save_cached_products(products)
+            else:
+                logger.info("No API rates in this run, not caching products")
             
         except Exception as e:
             logger.error(f"Error during comprehensive scraping: {e}")
@@ -538,10 +835,16 @@ class ComprehensiveHomeLoanScraper:
         return self.all_products
     
     def save_to_csv(self, filename: str = None) -> str:
-        """Save comprehensive data to CSV in the exact format requested"""
+        """Save comprehensive data to CSV in the exact format requested
+        
+        Filenames ending in .gz are written through gzip. Large exports get a
+        .csv.gz default filename.
+        """
         if not filename:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"comprehensive_home_loans_{timestamp}.csv"
+            if len(self.all_products) > GZIP_PRODUCT_THRESHOLD:
+                filename += ".gz"
         
         try:
             if not self.all_products:
@@ -570,43 +873,40 @@ class ComprehensiveHomeLoanScraper:
                 'Application URL'
             ]
             
-            with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
+            # compresslevel=1 is close to raw write speed on repetitive CSV data
+            if filename.endswith('.gz'):
+                csvfile = gzip.open(filename, 'wt', compresslevel=1, newline='', encoding='utf-8')
+            else:
+                csvfile = open(filename, 'w', newline='', encoding='utf-8')
+            
+            with csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(fieldnames)
                 
-                for product in self.all_products:
-                    row = {
-                        'Data Source': product.data_source,
-                        'Product Name': product.product_name,
-                        'Interest Rate': product.interest_rate,
-                        'Comparison Rate': product.comparison_rate,
-                        'Loan Purpose': product.loan_purpose,
-                        'Repayment Type': product.repayment_type,
-                        'Offset Available': product.offset_available,
-                        'Application Fee': product.application_fee,
-                        'Annual Fee': product.annual_fee,
-                        'Monthly Fee': product.monthly_fee,
-                        'Establishment Fee': product.establishment_fee,
-                        'Exit Fee': product.exit_fee,
-                        'Other Fees': product.other_fees,
-                        'Features': product.features,
-                        'Description': product.description,
-                        'Minimum Loan Amount': product.minimum_loan_amount,
-                        'Maximum Loan Amount': product.maximum_loan_amount,
-                        'Application URL': product.application_url
-                    }
-                    writer.writerow(row)
+                # Dataclass field order matches fieldnames, so rows stream
+                # straight from the products without building dicts
+                writer.writerows(astuple(product) for product in self.all_products)
             
             logger.info(f"Comprehensive data saved to {filename}")
             
+            # Gather summary counts in a single pass over the products
+            data_sources = set()
+            with_rates = with_comparison = with_offset = with_features = 0
+            for p in self.all_products:
+                data_sources.add(p.data_source)
+                with_rates += bool(p.interest_rate)
+                with_comparison += bool(p.comparison_rate)
+                with_offset += p.offset_available == 'Y'
+                with_features += bool(p.features)
+            
             # Print detailed summary
             print(f"\n=== COMPREHENSIVE SCRAPING SUMMARY ===")
             print(f"Total products: {len(self.all_products)}")
-            print(f"Data sources: {len(set(p.data_source for p in self.all_products))}")
-            print(f"Products with interest rates: {len([p for p in self.all_products if p.interest_rate])}")
-            print(f"Products with comparison rates: {len([p for p in self.all_products if p.comparison_rate])}")
-            print(f"Products with offset accounts: {len([p for p in self.all_products if p.offset_available == 'Y'])}")
-            print(f"Products with features: {len([p for p in self.all_products if p.features])}")
+            print(f"Data sources: {len(data_sources)}")
+            print(f"Products with interest rates: {with_rates}")
+            print(f"Products with comparison rates: {with_comparison}")
+            print(f"Products with offset accounts: {with_offset}")
+            print(f"Products with features: {with_features}")
             print(f"Data saved to: {filename}")
             print("\nColumns included:")
             for i, field in enumerate(fieldnames, 1):
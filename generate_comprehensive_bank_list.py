@@ -5,22 +5,124 @@ This creates a complete, up-to-date list of all Australian banking institutions
 """
 
 import requests
+import functools
 import json
+import re
+import string
 import time
-from typing import List, Dict
+from pathlib import Path
+from requests.adapters import HTTPAdapter
+from typing import List, Dict, NamedTuple, Optional
+from urllib3.util.retry import Retry
+
+# orjson parses/serializes the CDR payload much faster; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Brand ID character rules applied in a single str.translate pass
+BRAND_ID_TABLE = str.maketrans({
+    ' ': '-',
+    '&': 'and',
+    '.': None,
+    '(': None,
+    ')': None,
+    ',': None,
+    "'": None,
+    '"': None
+})
+
+# Base URI suffixes stripped before appending the CDS products path
+API_SUFFIX_PATTERN = re.compile(r'/(?:api|openbanking|OpenBanking)/?$')
+
+# Shared session so every CDR call reuses pooled keep-alive connections
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=3, backoff_factor=0.3)
+))
+SESSION.headers.update({"x-v": "1", "Accept-Encoding": "gzip"})
+
+# Last brands/summary payload and its ETag, revalidated with If-None-Match
+CDR_BRANDS_CACHE_PATH = Path('~/.cache/banking-tracker/cdr_brands.json').expanduser()
+CDR_BRANDS_ETAG_PATH = CDR_BRANDS_CACHE_PATH.with_suffix('.etag')
+
+# Generated module layouts - filled in once per run by save_bank_list
+BANK_LIST_PY_TEMPLATE = string.Template('''#!/usr/bin/env python3
+"""
+Comprehensive Australian Banking Institution List
+Generated from CDR Register API: ${now}
+Total Banks: ${total}
+"""
+
+# Format: (Bank Name, Brand ID, Products Endpoint, Base URI, Logo URI)
+COMPREHENSIVE_BANK_LIST = [
+${rows}]
+
+def get_bank_endpoints():
+    """Get list of (name, brand_id, endpoint) tuples for luke_prior_realtime.py"""
+    return [(name, brand_id, endpoint) for name, brand_id, endpoint, _, _ in COMPREHENSIVE_BANK_LIST]
+
+def get_bank_by_name(name):
+    """Get bank details by name"""
+    for bank in COMPREHENSIVE_BANK_LIST:
+        if bank[0] == name:
+            return bank
+    return None
+
+def get_major_banks():
+    """Get the Big 4 + major banks"""
+    major_bank_names = ['ANZ', 'CommBank', 'NATIONAL AUSTRALIA BANK', 'Westpac', 
+                       'ING BANK (Australia) Ltd', 'Macquarie Bank Limited', 'UBank']
+    return [get_bank_by_name(name) for name in major_bank_names if get_bank_by_name(name)]
+
+# Metadata
+GENERATION_DATE = '${now}'
+TOTAL_BANKS = ${total}
+CDR_REGISTER_URL = 'https://api.cdr.gov.au/cdr-register/v1/all/data-holders/brands/summary'
+''')
+
+SIMPLE_BANK_LIST_TEMPLATE = string.Template('''# Simple bank list for luke_prior_realtime.py
+# Generated from CDR Register
+
+BANKS_FROM_CDR_REGISTER = [
+${rows}]
+''')
+
+class BankRecord(NamedTuple):
+    """One processed banking brand - field names match the JSON output keys"""
+    name: str
+    brand_id: str
+    products_endpoint: str
+    base_uri: str
+    logo_uri: str
 
 def fetch_cdr_banking_data():
     """Fetch all banking data holders from CDR register"""
     print("🔍 Fetching comprehensive banking data from CDR register...")
     
     url = "https://api.cdr.gov.au/cdr-register/v1/all/data-holders/brands/summary"
-    headers = {"x-v": "1"}
     
     try:
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
+        headers = {}
+        if CDR_BRANDS_CACHE_PATH.exists() and CDR_BRANDS_ETAG_PATH.exists():
+            headers['If-None-Match'] = CDR_BRANDS_ETAG_PATH.read_text(encoding='utf-8').strip()
+        
+        response = SESSION.get(url, headers=headers, timeout=30)
+        
+        if response.status_code == 304:
+            print("♻️ CDR register unchanged - using cached brand list")
+            raw = CDR_BRANDS_CACHE_PATH.read_bytes()
+        else:
+            response.raise_for_status()
+            raw = response.content
+            save_cdr_brands_cache(raw, response.headers.get('ETag'))
         
-        data = response.json()
+        # Parse the raw bytes directly - response.json() would go through
+        # response.text and its charset detection first
+        data = orjson.loads(raw) if orjson else json.loads(raw)
         print(f"✅ Fetched {len(data['data'])} total brands from CDR register")
         
         # Filter for banking only
@@ -37,150 +139,107 @@ def fetch_cdr_banking_data():
         print(f"❌ Error fetching CDR data: {e}")
         return []
 
-def process_banking_brands(brands: List[Dict]) -> List[tuple]:
+def save_cdr_brands_cache(raw: bytes, etag: str):
+    """Persist the brands/summary payload and its ETag for the next run"""
+    if not etag:
+        return
+    
+    try:
+        CDR_BRANDS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CDR_BRANDS_CACHE_PATH.write_bytes(raw)
+        CDR_BRANDS_ETAG_PATH.write_text(etag, encoding='utf-8')
+    except OSError as e:
+        print(f"⚠️ Could not write CDR brands cache: {e}")
+
+def process_brand(brand: Dict) -> Optional[BankRecord]:
+    """Process a single banking brand into our format (None if unusable)"""
+    brand_name = brand.get('brandName', 'Unknown Bank')
+    public_base_uri = brand.get('publicBaseUri', '')
+    logo_uri = brand.get('logoUri', '')
+    
+    if not public_base_uri:
+        return None
+        
+    # Construct products endpoint
+    products_endpoint = construct_products_endpoint(public_base_uri)
+    
+    # Generate brand ID (simplified)
+    brand_id = generate_brand_id(brand_name)
+    
+    return BankRecord(brand_name, brand_id, products_endpoint, public_base_uri, logo_uri)
+
+def process_banking_brands(brands: List[Dict]) -> List[BankRecord]:
     """Process banking brands into our format"""
     processed_banks = []
     
     for brand in brands:
-        brand_name = brand.get('brandName', 'Unknown Bank')
-        public_base_uri = brand.get('publicBaseUri', '')
-        logo_uri = brand.get('logoUri', '')
-        
-        if not public_base_uri:
-            print(f"⚠️ {brand_name}: No public base URI")
+        bank = process_brand(brand)
+        if bank is None:
+            print(f"⚠️ {brand.get('brandName', 'Unknown Bank')}: No public base URI")
             continue
-            
-        # Construct products endpoint
-        products_endpoint = construct_products_endpoint(public_base_uri)
-        
-        # Generate brand ID (simplified)
-        brand_id = generate_brand_id(brand_name)
         
-        processed_banks.append((brand_name, brand_id, products_endpoint, public_base_uri, logo_uri))
-        print(f"✅ {brand_name}: {products_endpoint}")
+        processed_banks.append(bank)
+        print(f"✅ {bank.name}: {bank.products_endpoint}")
     
     return processed_banks
 
+@functools.lru_cache(maxsize=4096)
 def construct_products_endpoint(base_uri: str) -> str:
     """Construct CDS products endpoint from base URI"""
-    if not base_uri.endswith('/'):
-        base_uri += '/'
-    
-    # Remove common trailing paths that might interfere
-    if base_uri.endswith('/api/'):
-        base_uri = base_uri[:-4]
-    elif base_uri.endswith('/public/'):
-        # Keep /public/ as it's often needed
-        pass
-    elif base_uri.endswith('/openbanking/'):
-        base_uri = base_uri[:-12]
-    elif base_uri.endswith('/OpenBanking/'):
-        base_uri = base_uri[:-12]
+    # Remove common trailing paths that might interfere (/public/ is kept
+    # as it's often needed)
+    base_uri = API_SUFFIX_PATTERN.sub('/', base_uri)
     
     # Ensure trailing slash
     if not base_uri.endswith('/'):
         base_uri += '/'
     
     # Construct the CDS products endpoint
-    products_endpoint = f"{base_uri}cds-au/v1/banking/products"
-    
-    return products_endpoint
+    return f"{base_uri}cds-au/v1/banking/products"
 
+@functools.lru_cache(maxsize=4096)
 def generate_brand_id(brand_name: str) -> str:
     """Generate a simple brand ID from brand name"""
-    # Clean up the name and create ID
-    clean_name = brand_name.lower()
-    clean_name = clean_name.replace(' ', '-')
-    clean_name = clean_name.replace('.', '')
-    clean_name = clean_name.replace('&', 'and')
-    clean_name = clean_name.replace('(', '').replace(')', '')
-    clean_name = clean_name.replace(',', '')
-    clean_name = clean_name.replace("'", '')
-    clean_name = clean_name.replace('"', '')
-    
-    # Limit length
-    if len(clean_name) > 50:
-        clean_name = clean_name[:50]
-    
-    return clean_name
-
-def save_bank_list(banks: List[tuple]):
+    # Clean up the name and create ID (limited to 50 characters)
+    return brand_name.lower().translate(BRAND_ID_TABLE)[:50]
+
+def save_bank_list(banks: List[BankRecord]):
     """Save the comprehensive bank list"""
     timestamp = int(time.time())
+    now = time.strftime('%Y-%m-%d %H:%M:%S')
     
     # Save as Python file for direct import
     py_file = f"comprehensive_bank_list_{timestamp}.py"
-    with open(py_file, 'w') as f:
-        f.write("#!/usr/bin/env python3\n")
-        f.write('"""\n')
-        f.write("Comprehensive Australian Banking Institution List\n")
-        f.write(f"Generated from CDR Register API: {time.strftime('%Y-%m-%d %H:%M:%S')}\n")
-        f.write(f"Total Banks: {len(banks)}\n")
-        f.write('"""\n\n')
-        
-        f.write("# Format: (Bank Name, Brand ID, Products Endpoint, Base URI, Logo URI)\n")
-        f.write("COMPREHENSIVE_BANK_LIST = [\n")
-        
-        for bank_name, brand_id, products_endpoint, base_uri, logo_uri in banks:
-            f.write(f'    ("{bank_name}", "{brand_id}", "{products_endpoint}", "{base_uri}", "{logo_uri}"),\n')
-        
-        f.write("]\n\n")
-        
-        # Add convenience functions
-        f.write("def get_bank_endpoints():\n")
-        f.write('    """Get list of (name, brand_id, endpoint) tuples for luke_prior_realtime.py"""\n')
-        f.write("    return [(name, brand_id, endpoint) for name, brand_id, endpoint, _, _ in COMPREHENSIVE_BANK_LIST]\n\n")
-        
-        f.write("def get_bank_by_name(name):\n")
-        f.write('    """Get bank details by name"""\n')
-        f.write("    for bank in COMPREHENSIVE_BANK_LIST:\n")
-        f.write("        if bank[0] == name:\n")
-        f.write("            return bank\n")
-        f.write("    return None\n\n")
-        
-        f.write("def get_major_banks():\n")
-        f.write('    """Get the Big 4 + major banks"""\n')
-        f.write("    major_bank_names = ['ANZ', 'CommBank', 'NATIONAL AUSTRALIA BANK', 'Westpac', \n")
-        f.write("                       'ING BANK (Australia) Ltd', 'Macquarie Bank Limited', 'UBank']\n")
-        f.write("    return [get_bank_by_name(name) for name in major_bank_names if get_bank_by_name(name)]\n\n")
-        
-        f.write(f"# Metadata\n")
-        f.write(f"GENERATION_DATE = '{time.strftime('%Y-%m-%d %H:%M:%S')}'\n")
-        f.write(f"TOTAL_BANKS = {len(banks)}\n")
-        f.write(f"CDR_REGISTER_URL = 'https://api.cdr.gov.au/cdr-register/v1/all/data-holders/brands/summary'\n")
+    Path(py_file).write_text(BANK_LIST_PY_TEMPLATE.substitute(
+        now=now,
+        total=len(banks),
+        rows="".join(
+            f'    ("{bank_name}", "{brand_id}", "{products_endpoint}", "{base_uri}", "{logo_uri}"),\n'
+            for bank_name, brand_id, products_endpoint, base_uri, logo_uri in banks
+        )
+    ), encoding='utf-8')
     
     # Save as JSON for external use
     json_file = f"comprehensive_bank_list_{timestamp}.json"
     json_data = {
-        "generation_date": time.strftime('%Y-%m-%d %H:%M:%S'),
+        "generation_date": now,
         "total_banks": len(banks),
         "cdr_register_url": "https://api.cdr.gov.au/cdr-register/v1/all/data-holders/brands/summary",
-        "banks": [
-            {
-                "name": bank_name,
-                "brand_id": brand_id,
-                "products_endpoint": products_endpoint,
-                "base_uri": base_uri,
-                "logo_uri": logo_uri
-            }
-            for bank_name, brand_id, products_endpoint, base_uri, logo_uri in banks
-        ]
+        "banks": [bank._asdict() for bank in banks]
     }
     
-    with open(json_file, 'w') as f:
-        json.dump(json_data, f, indent=2)
+    # orjson already produces UTF-8 bytes - write them without a decode/encode round-trip
+    if orjson:
+        Path(json_file).write_bytes(orjson.dumps(json_data, option=orjson.OPT_INDENT_2))
+    else:
+        Path(json_file).write_text(json.dumps(json_data, indent=2), encoding='utf-8')
     
     # Save as simple list for luke_prior_realtime.py
     simple_file = f"luke_prior_bank_list_{timestamp}.py"
-    with open(simple_file, 'w') as f:
-        f.write("# Simple bank list for luke_prior_realtime.py\n")
-        f.write("# Generated from CDR Register\n\n")
-        f.write("BANKS_FROM_CDR_REGISTER = [\n")
-        
-        for bank_name, brand_id, products_endpoint, _, _ in banks:
-            f.write(f'    ("{bank_name}", "{brand_id}", "{products_endpoint}"),\n')
-        
-        f.write("]\n")
+    Path(simple_file).write_text(SIMPLE_BANK_LIST_TEMPLATE.substitute(rows="".join(
+        f'    ("{bank_name}", "{brand_id}", "{products_endpoint}"),\n'
+        for bank_name, brand_id, products_endpoint, _, _ in banks
+    )), encoding='utf-8')
     
     print(f"\n💾 Saved comprehensive bank list:")
     print(f"   🐍 Python: {py_file}")
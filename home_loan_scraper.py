@@ -5,16 +5,17 @@ Home Loan Data Scraper for Consumer Data Standards Australia Product Comparator
 This scraper extracts home loan product data from multiple data sources and exports to CSV.
 """
 
-import time
 import json
-import pandas as pd
+import csv
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
 import logging
 from typing import List, Dict, Any
 from dataclasses import dataclass
@@ -27,7 +28,65 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Import the comprehensive bank list
+try:
+    from luke_prior_bank_list_1758106523 import BANKS_FROM_CDR_REGISTER
+except ImportError:
+    logger.warning("Could not import bank list, using fallback")
+    BANKS_FROM_CDR_REGISTER = [
+        ("ANZ", "anz", "https://api.anz/cds-au/v1/banking/products"),
+        ("CommBank", "commbank", "https://api.commbank.com.au/public/cds-au/v1/banking/products"),
+        ("NATIONAL AUSTRALIA BANK", "nab", "https://openbank.api.nab.com.au/cds-au/v1/banking/products"),
+        ("Westpac", "westpac", "https://digital-api.westpac.com.au/cds-au/v1/banking/products"),
+    ]
+
+# Concurrent bank requests share one keep-alive pool
+API_WORKERS = 32
+
+# Selectors for the product comparator page, passed to PRODUCTS_SCRIPT
+PRODUCT_SELECTOR = ".product, .mortgage-product, [data-product-type='mortgage']"
+PRODUCT_FIELD_SELECTORS = {
+    'product_name': ".product-name, .name, h3, h4",
+    'interest_rate': ".interest-rate, .rate, [data-field='interest-rate']",
+    'comparison_rate': ".comparison-rate, [data-field='comparison-rate']",
+    'loan_purpose': ".loan-purpose, .purpose, [data-field='loan-purpose']",
+    'repayment_type': ".repayment-type, [data-field='repayment-type']",
+}
+FEATURE_SELECTOR = ".feature, .features"
+FEE_SELECTOR = ".fee, .fees, [data-field*='fee']"
+FEE_ROW_SELECTOR = "tr, li, .fee-item"
+FEE_CELL_SELECTOR = "td, .fee-name, .fee-amount"
+
+# Collects every product container with its text fields, offset text and
+# fee texts in one WebDriver round-trip instead of one find_element call
+# per field per product
+PRODUCTS_SCRIPT = """
+const [productSelector, fieldSelectors, featureSelector, feeSelector, feeRowSelector, feeCellSelector] = arguments;
+const text = (root, selector) => {
+    const e = root.querySelector(selector);
+    return e ? e.innerText.trim() : '';
+};
+const texts = (root, selector) => [...root.querySelectorAll(selector)].map(e => e.innerText.trim());
+const mentionsOffset = e => [...e.childNodes].some(
+    n => n.nodeType === Node.TEXT_NODE && /[oO]ffset/.test(n.nodeValue)
+);
+return [...document.querySelectorAll(productSelector)].map(e => {
+    const product = {};
+    for (const [field, selector] of Object.entries(fieldSelectors)) {
+        product[field] = text(e, selector);
+    }
+    const offset = [...e.querySelectorAll('*')].find(mentionsOffset);
+    product.offset_text = offset ? offset.innerText : '';
+    product.feature_texts = texts(e, featureSelector);
+    product.fee_texts = texts(e, feeSelector);
+    product.fee_rows = [...e.querySelectorAll(feeRowSelector)]
+        .map(row => texts(row, feeCellSelector))
+        .filter(cells => cells.length >= 2);
+    return product;
+});
+"""
+
+@dataclass(slots=True, frozen=True)
 class HomeLoanProduct:
     """Data structure for home loan products"""
     data_source: str
@@ -42,13 +101,109 @@ class HomeLoanProduct:
 class HomeLoanScraper:
     """Scraper for Consumer Data Standards Australia Product Comparator Demo"""
     
-    def __init__(self, headless: bool = True):
+    def __init__(self, headless: bool = True, use_api: bool = True):
         self.base_url = "https://consumerdatastandardsaustralia.github.io/product-comparator-demo/"
         self.driver = None
         self.headless = headless
+        self.use_api = use_api
         self.data_sources = []
         self.all_products = []
         
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=API_WORKERS, pool_maxsize=API_WORKERS)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'x-v': '3',
+            'Accept': 'application/json'
+        })
+    
+    def fetch_bank_products(self, bank: tuple) -> List[Dict[str, Any]]:
+        """Fetch the residential mortgage list for one bank from its CDR products endpoint"""
+        bank_name, _, endpoint = bank[:3]
+        
+        try:
+            response = self.session.get(
+                endpoint,
+                params={'product-category': 'RESIDENTIAL_MORTGAGES', 'page-size': 100},
+                timeout=30
+            )
+            if response.status_code != 200:
+                logger.warning(f"{bank_name}: HTTP {response.status_code}")
+                return []
+            
+            api_products = response.json().get('data', {}).get('products', [])
+        except Exception as e:
+            logger.warning(f"Error fetching products for {bank_name}: {e}")
+            return []
+        
+        return [api_product for api_product in api_products
+                if api_product.get('productCategory', 'RESIDENTIAL_MORTGAGES') == 'RESIDENTIAL_MORTGAGES']
+    
+    def fetch_product_detail(self, endpoint: str, api_product: Dict[str, Any]) -> Dict[str, Any]:
+        """Fetch a product's detail record, which carries its rates, features and fees
+        
+        Falls back to the list entry if the detail request fails.
+        """
+        try:
+            response = self.session.get(f"{endpoint}/{api_product.get('productId', '')}", timeout=30)
+            if response.status_code == 200:
+                return response.json().get('data') or api_product
+            logger.warning(f"{api_product.get('name', 'Unknown product')}: detail HTTP {response.status_code}")
+        except Exception as e:
+            logger.warning(f"Error fetching details for {api_product.get('name', 'Unknown product')}: {e}")
+        return api_product
+    
+    def product_from_api_data(self, api_product: Dict[str, Any], data_source: str) -> HomeLoanProduct:
+        """Map a CDR product JSON object to a HomeLoanProduct"""
+        lending_rates = api_product.get('lendingRates') or [{}]
+        first_rate = lending_rates[0]
+        
+        def as_percent(value) -> str:
+            try:
+                return f"{float(value) * 100:.2f}%"
+            except (TypeError, ValueError):
+                return ''
+        
+        offset_available = "Y" if any(
+            feature.get('featureType') == 'OFFSET' for feature in api_product.get('features', [])
+        ) else "N"
+        
+        fees = {
+            fee.get('name', 'General Fee'): fee.get('amount') or fee.get('accruedRate') or fee.get('transactionRate', '')
+            for fee in api_product.get('fees', [])
+        }
+        
+        return HomeLoanProduct(
+            data_source=data_source,
+            product_name=api_product.get('name', ''),
+            interest_rate=as_percent(first_rate.get('rate')),
+            comparison_rate=as_percent(first_rate.get('comparisonRate')),
+            loan_purpose=first_rate.get('loanPurpose', ''),
+            repayment_type=first_rate.get('repaymentType', ''),
+            offset_available=offset_available,
+            fees=fees
+        )
+    
+    def scrape_from_api(self) -> List[HomeLoanProduct]:
+        """Fetch every bank's residential mortgages concurrently - no browser required
+        
+        The products list carries no rates, so each product's detail record is
+        fetched on the same pool once its bank's list arrives.
+        """
+        self.data_sources = [bank[0] for bank in BANKS_FROM_CDR_REGISTER]
+        
+        with ThreadPoolExecutor(max_workers=API_WORKERS) as executor:
+            detail_futures = [
+                (bank[0], executor.submit(self.fetch_product_detail, bank[2], api_product))
+                for bank, api_products in zip(BANKS_FROM_CDR_REGISTER, executor.map(self.fetch_bank_products, BANKS_FROM_CDR_REGISTER))
+                for api_product in api_products
+            ]
+            for bank_name, future in detail_futures:
+                self.all_products.append(self.product_from_api_data(future.result(), bank_name))
+        
+        logger.info(f"Total products fetched from CDR APIs: {len(self.all_products)}")
+        return self.all_products
+        
     def setup_driver(self):
         """Initialize the Chrome WebDriver with appropriate options"""
         options = Options()
@@ -79,8 +234,8 @@ class HomeLoanScraper:
                 EC.presence_of_element_located((By.TAG_NAME, "body"))
             )
             
-            # Give additional time for JavaScript to execute
-            time.sleep(5)
+            # Wait for the JavaScript-rendered products instead of a fixed sleep
+            self.wait_for_products()
             logger.info("Page loaded successfully")
             
         except TimeoutException:
@@ -90,6 +245,18 @@ class HomeLoanScraper:
             logger.error(f"Error loading page: {e}")
             raise
     
+    def wait_for_products(self, timeout: int = 10):
+        """Wait until product containers render, or at least until the document is complete"""
+        try:
+            WebDriverWait(self.driver, timeout).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PRODUCT_SELECTOR))
+            )
+        except TimeoutException:
+            # The page may have no product containers at all
+            WebDriverWait(self.driver, 5).until(
+                lambda d: d.execute_script("return document.readyState") == 'complete'
+            )
+    
     def discover_data_sources(self) -> List[str]:
         """Identify all available data sources from the Data Sources section"""
         try:
@@ -129,13 +296,15 @@ class HomeLoanScraper:
             # This will need to be customized based on the actual website structure
             # We need to navigate to the Console Output > Products > Residential Mortgages
             
-            # Look for product containers
-            product_elements = self.driver.find_elements(By.CSS_SELECTOR, 
-                                                       ".product, .mortgage-product, [data-product-type='mortgage']")
+            # Look for product containers (with their text fields already read)
+            products_raw = self.driver.execute_script(
+                PRODUCTS_SCRIPT, PRODUCT_SELECTOR, PRODUCT_FIELD_SELECTORS, FEATURE_SELECTOR,
+                FEE_SELECTOR, FEE_ROW_SELECTOR, FEE_CELL_SELECTOR
+            ) or []
             
-            for product_element in product_elements:
+            for product_raw in products_raw:
                 try:
-                    product_data = self.extract_product_data(product_element, data_source)
+                    product_data = self.extract_product_data(product_raw, data_source)
                     if product_data:
                         products.append(product_data)
                 except Exception as e:
@@ -149,37 +318,22 @@ class HomeLoanScraper:
         
         return products
     
-    def extract_product_data(self, element, data_source: str) -> HomeLoanProduct:
-        """Extract individual product data from a product element"""
+    def extract_product_data(self, product_raw: Dict[str, Any], data_source: str) -> HomeLoanProduct:
+        """Extract individual product data from a PRODUCTS_SCRIPT result"""
         try:
-            # Extract product name
-            product_name = self.safe_extract_text(element, ".product-name, .name, h3, h4")
-            
-            # Extract interest rate
-            interest_rate = self.safe_extract_text(element, ".interest-rate, .rate, [data-field='interest-rate']")
-            
-            # Extract comparison rate
-            comparison_rate = self.safe_extract_text(element, ".comparison-rate, [data-field='comparison-rate']")
-            
-            # Extract loan purpose
-            loan_purpose = self.safe_extract_text(element, ".loan-purpose, .purpose, [data-field='loan-purpose']")
-            
-            # Extract repayment type
-            repayment_type = self.safe_extract_text(element, ".repayment-type, [data-field='repayment-type']")
-            
             # Extract offset availability
-            offset_available = self.extract_offset_feature(element)
+            offset_available = self.extract_offset_feature(product_raw)
             
             # Extract fees
-            fees = self.extract_fees(element)
+            fees = self.extract_fees(product_raw)
             
             return HomeLoanProduct(
                 data_source=data_source,
-                product_name=product_name,
-                interest_rate=interest_rate,
-                comparison_rate=comparison_rate,
-                loan_purpose=loan_purpose,
-                repayment_type=repayment_type,
+                product_name=product_raw['product_name'],
+                interest_rate=product_raw['interest_rate'],
+                comparison_rate=product_raw['comparison_rate'],
+                loan_purpose=product_raw['loan_purpose'],
+                repayment_type=product_raw['repayment_type'],
                 offset_available=offset_available,
                 fees=fees
             )
@@ -188,32 +342,20 @@ class HomeLoanScraper:
             logger.warning(f"Error extracting product data: {e}")
             return None
     
-    def safe_extract_text(self, parent_element, selector: str) -> str:
-        """Safely extract text from an element using CSS selector"""
-        try:
-            element = parent_element.find_element(By.CSS_SELECTOR, selector)
-            return element.text.strip()
-        except NoSuchElementException:
-            return ""
-    
-    def extract_offset_feature(self, element) -> str:
+    def extract_offset_feature(self, product_raw: Dict[str, Any]) -> str:
         """Extract whether offset account is available"""
         try:
-            # Look for offset-related text or elements
-            offset_elements = element.find_elements(By.XPATH, 
-                                                  ".//*[contains(text(), 'offset') or contains(text(), 'Offset')]")
-            
-            if offset_elements:
-                text = offset_elements[0].text.lower()
+            # Look for offset-related text
+            if product_raw['offset_text']:
+                text = product_raw['offset_text'].lower()
                 if 'yes' in text or 'available' in text or 'included' in text:
                     return "Y"
                 elif 'no' in text or 'not available' in text:
                     return "N"
             
             # Check for boolean indicators
-            features = element.find_elements(By.CSS_SELECTOR, ".feature, .features")
-            for feature in features:
-                if 'offset' in feature.text.lower():
+            for feature_text in product_raw['feature_texts']:
+                if 'offset' in feature_text.lower():
                     return "Y"
             
             return "N"
@@ -221,33 +363,26 @@ class HomeLoanScraper:
         except Exception:
             return "N"
     
-    def extract_fees(self, element) -> Dict[str, str]:
+    def extract_fees(self, product_raw: Dict[str, Any]) -> Dict[str, str]:
         """Extract fee information"""
         fees = {}
         
         try:
-            # Look for fee elements
-            fee_elements = element.find_elements(By.CSS_SELECTOR, 
-                                               ".fee, .fees, [data-field*='fee']")
-            
-            for fee_element in fee_elements:
-                fee_text = fee_element.text.strip()
+            # Look for fee texts
+            for fee_text in product_raw['fee_texts']:
                 if fee_text:
-                    # Try to parse fee name and amount
-                    if ':' in fee_text:
-                        fee_name, fee_amount = fee_text.split(':', 1)
+                    # Try to parse fee name and amount - partition scans the
+                    # text once instead of an 'in' test followed by split
+                    fee_name, separator, fee_amount = fee_text.partition(':')
+                    if separator:
                         fees[fee_name.strip()] = fee_amount.strip()
                     else:
                         fees['General Fee'] = fee_text
             
             # If no fees found, check for fee tables or lists
             if not fees:
-                fee_rows = element.find_elements(By.CSS_SELECTOR, 
-                                               "tr, li, .fee-item")
-                for row in fee_rows:
-                    cells = row.find_elements(By.CSS_SELECTOR, "td, .fee-name, .fee-amount")
-                    if len(cells) >= 2:
-                        fees[cells[0].text.strip()] = cells[1].text.strip()
+                for cells in product_raw['fee_rows']:
+                    fees[cells[0]] = cells[1]
             
         except Exception as e:
             logger.warning(f"Error extracting fees: {e}")
@@ -256,6 +391,13 @@ class HomeLoanScraper:
     
     def scrape_all_data(self) -> List[HomeLoanProduct]:
         """Main method to scrape all home loan data"""
+        if self.use_api:
+            # Only skip the browser if the APIs actually gave us rates
+            if any(product.interest_rate for product in self.scrape_from_api()):
+                return self.all_products
+            logger.info("No rates from CDR APIs, falling back to the product comparator page")
+            self.all_products = []
+        
         try:
             self.setup_driver()
             self.load_page()
@@ -278,9 +420,6 @@ class HomeLoanScraper:
                     
                     products = self.extract_residential_mortgages(data_source)
                     self.all_products.extend(products)
-                    
-                    # Small delay between data sources
-                    time.sleep(2)
             
             logger.info(f"Total products scraped: {len(self.all_products)}")
             return self.all_products
@@ -299,15 +438,11 @@ class HomeLoanScraper:
             filename = f"home_loans_{timestamp}.csv"
         
         try:
-            # Convert products to DataFrame
-            data_rows = []
+            rows = []
             all_fee_types = set()
             
-            # First pass: collect all unique fee types
-            for product in self.all_products:
-                all_fee_types.update(product.fees.keys())
-            
-            # Second pass: create rows with all fee columns
+            # Single pass over the products: build each row and grow the fee
+            # column set as new fee types appear
             for product in self.all_products:
                 row = {
                     'Data Source': product.data_source,
@@ -318,20 +453,26 @@ class HomeLoanScraper:
                     'Repayment Type': product.repayment_type,
                     'Offset Available': product.offset_available,
                 }
+                for fee_type, fee_amount in product.fees.items():
+                    row[f'Fee - {fee_type}'] = fee_amount
                 
-                # Add fee columns
-                for fee_type in sorted(all_fee_types):
-                    row[f'Fee - {fee_type}'] = product.fees.get(fee_type, '')
-                
-                data_rows.append(row)
+                all_fee_types.update(product.fees)
+                rows.append(row)
+            
+            fieldnames = [
+                'Data Source', 'Product Name', 'Interest Rate', 'Comparison Rate',
+                'Loan Purpose', 'Repayment Type', 'Offset Available'
+            ] + [f'Fee - {fee_type}' for fee_type in sorted(all_fee_types)]
             
-            # Create DataFrame and save to CSV
-            df = pd.DataFrame(data_rows)
-            df.to_csv(filename, index=False)
+            # Fee columns a product doesn't have are filled by restval
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval='')
+                writer.writeheader()
+                writer.writerows(rows)
             
             logger.info(f"Data saved to {filename}")
-            logger.info(f"Columns: {list(df.columns)}")
-            logger.info(f"Rows: {len(df)}")
+            logger.info(f"Columns: {fieldnames}")
+            logger.info(f"Rows: {len(self.all_products)}")
             
             return filename
             
@@ -6,14 +6,36 @@ Now correctly extracts offset, redraw, loan purpose, and repayment type
 from the actual data structure discovered in the Open Banking Tracker.
 """
 
+import argparse
 import json
 import csv
+import functools
+import io
+import itertools
+import re
+import sys
 import time
 import requests
 from datetime import datetime
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from operator import attrgetter
+from pathlib import Path
 import logging
+from collections import Counter
+
+# orjson parses the multi-MB mortgage feed much faster; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental parser for --low-memory runs
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 # Configure logging
 logging.basicConfig(
@@ -22,7 +44,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Known CDR purpose/repayment values map to bits; the labels are indexed by
+# the combined mask, e.g. INVESTMENT | OWNER_OCCUPIED -> "Both"
+PURPOSE_BITS = {'INVESTMENT': 1, 'OWNER_OCCUPIED': 2}
+PURPOSE_LABELS = ('Not Specified', 'Investment', 'Owner Occupier', 'Both')
+REPAYMENT_BITS = {'PRINCIPAL_AND_INTEREST': 1, 'INTEREST_ONLY': 2}
+REPAYMENT_LABELS = ('Not Specified', 'Principal and Interest', 'Interest Only', 'Both')
+
+# One scan for all feature keywords - the matching group picks the label
+FEATURE_KEYWORD_PATTERN = re.compile(r'(package|premium|advantage)|(construction|building)|(split|portion)')
+FEATURE_KEYWORD_LABELS = ('Package Product', 'Construction Loan', 'Split Loan Option')
+
+@dataclass(slots=True, frozen=True)
 class ImprovedHomeLoanProduct:
     """Improved data structure with proper feature extraction"""
     brand_id: str
@@ -52,6 +85,63 @@ class ImprovedHomeLoanProduct:
     monthly_repayment_500k: str
     monthly_repayment_750k: str
 
+# CSV header and the product attribute written under it
+CSV_COLUMNS = (
+    ('Brand ID', 'brand_id'),
+    ('Brand Name', 'brand_name'),
+    ('Product ID', 'product_id'),
+    ('Product Name', 'product_name'),
+    ('Description', 'description'),
+    ('Variable Rate', 'variable_rate'),
+    ('Fixed Rate 1Yr', 'fixed_rate_1yr'),
+    ('Fixed Rate 2Yr', 'fixed_rate_2yr'),
+    ('Fixed Rate 3Yr', 'fixed_rate_3yr'),
+    ('Fixed Rate 4Yr', 'fixed_rate_4yr'),
+    ('Fixed Rate 5Yr', 'fixed_rate_5yr'),
+    ('Comparison Rate', 'comparison_rate'),
+    ('Loan Purpose', 'loan_purpose'),
+    ('Repayment Type', 'repayment_type'),
+    ('Offset Available', 'offset_available'),
+    ('Redraw Available', 'redraw_available'),
+    ('Application Fee', 'application_fee'),
+    ('Annual Fee', 'annual_fee'),
+    ('Exit Fee', 'exit_fee'),
+    ('Other Fees', 'other_fees'),
+    ('Features', 'features_summary'),
+    ('Application URL', 'application_url'),
+    ('Last Updated', 'last_updated'),
+    ('Monthly Repayment 300K', 'monthly_repayment_300k'),
+    ('Monthly Repayment 500K', 'monthly_repayment_500k'),
+    ('Monthly Repayment 750K', 'monthly_repayment_750k'),
+)
+CSV_HEADER = tuple(header for header, _ in CSV_COLUMNS)
+CSV_ROW = attrgetter(*(attribute for _, attribute in CSV_COLUMNS))
+
+# Last mortgage feed and its ETag, revalidated with If-None-Match
+MORTGAGE_FEED_CACHE_PATH = Path('~/.cache/banking-tracker/residential_mortgages.json').expanduser()
+MORTGAGE_FEED_ETAG_PATH = MORTGAGE_FEED_CACHE_PATH.with_suffix('.etag')
+
+# Products per worker task in --parallel mode
+PROCESS_CHUNK_SIZE = 256
+
+def intern_text(value: Any) -> Any:
+    """Intern a string so repeats share one object; leave nulls and other values as-is"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+@functools.lru_cache(maxsize=4096)
+def annuity_factor(rate_bp: int) -> float:
+    """Monthly repayment per dollar borrowed over 30 years at an annual rate in basis points"""
+    monthly_rate = rate_bp / 10000 / 12
+    n_payments = 30 * 12  # 30 years
+    growth = (1 + monthly_rate)**n_payments
+    return monthly_rate * growth / (growth - 1)
+
+@functools.lru_cache(maxsize=4096)
+def monthly_repayments(rate_bp: int) -> tuple:
+    """Formatted 30-year monthly repayments on $300k/$500k/$750k at a basis-point rate"""
+    factor = annuity_factor(rate_bp)
+    return f"${300000 * factor:,.0f}", f"${500000 * factor:,.0f}", f"${750000 * factor:,.0f}"
+
 class ImprovedCDRScraper:
     """Improved scraper with proper feature extraction"""
     
@@ -60,7 +150,8 @@ class ImprovedCDRScraper:
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Accept-Encoding': 'gzip, deflate'
         })
         self.all_products = []
     
@@ -68,22 +159,36 @@ class ImprovedCDRScraper:
         """Fetch residential mortgage data"""
         try:
             logger.info("Fetching mortgage data with improved extraction...")
-            response = self.session.get(self.residential_mortgages_url, timeout=60)
+            headers = {}
+            if MORTGAGE_FEED_CACHE_PATH.exists() and MORTGAGE_FEED_ETAG_PATH.exists():
+                headers['If-None-Match'] = MORTGAGE_FEED_ETAG_PATH.read_text(encoding='utf-8').strip()
+            
+            response = self.session.get(self.residential_mortgages_url, headers=headers, timeout=60)
             
-            if response.status_code == 200:
-                products = response.json()
-                logger.info(f"Retrieved {len(products)} mortgage products")
-                return products
+            if response.status_code == 304:
+                logger.info("Mortgage feed unchanged - using cached copy")
+                raw = MORTGAGE_FEED_CACHE_PATH.read_bytes()
+            elif response.status_code == 200:
+                raw = response.content
+                self.save_feed_cache(raw, response.headers.get('ETag'))
             else:
                 logger.warning(f"Failed to fetch data: {response.status_code}")
                 return []
+            
+            # Parse the raw bytes directly rather than via response.text
+            products = orjson.loads(raw) if orjson else json.loads(raw)
+            logger.info(f"Retrieved {len(products)} mortgage products")
+            return products
                 
         except Exception as e:
             logger.error(f"Error fetching mortgage data: {e}")
             return []
     
-    def extract_rates_improved(self, product: Dict[str, Any]) -> Dict[str, str]:
-        """Extract rates with improved logic"""
+    def extract_rate_derived_fields(self, product: Dict[str, Any]) -> tuple:
+        """Extract rates, loan purpose and repayment type in one pass over product['rate']
+        
+        Returns (rates, loan_purpose, repayment_type).
+        """
         rates = {
             'variable_rate': '',
             'fixed_rate_1yr': '',
@@ -93,14 +198,41 @@ class ImprovedCDRScraper:
             'fixed_rate_5yr': '',
             'comparison_rate': ''
         }
+        # Bitmasks of the known values seen, plus the unrecognised value if
+        # there was exactly one ('' once several different ones were seen)
+        purpose_mask = 0
+        other_purpose = None
+        repayment_mask = 0
+        other_repayment_type = None
         
         try:
-            rate_data = product.get('rate', [])
-            
-            for rate in rate_data:
-                rate_type = rate.get('lendingRateType', '').upper()
-                rate_value = rate.get('rate', 0)
-                period = rate.get('period', 0)
+            for rate in product.get('rate', []):
+                get = rate.get
+                rate_type = get('lendingRateType')
+                rate_value = get('rate', 0)
+                period = get('period', 0)
+                
+                # Loan purpose from rate.purpose, repayment type from rate.repaymentType.
+                # CDR enums are upper case already, so values are compared as-is
+                purpose = get('purpose')
+                if purpose:
+                    bit = PURPOSE_BITS.get(purpose)
+                    if bit:
+                        purpose_mask |= bit
+                    elif other_purpose is None:
+                        other_purpose = purpose
+                    elif purpose != other_purpose:
+                        other_purpose = ''
+                
+                repayment_type = get('repaymentType')
+                if repayment_type:
+                    bit = REPAYMENT_BITS.get(repayment_type)
+                    if bit:
+                        repayment_mask |= bit
+                    elif other_repayment_type is None:
+                        other_repayment_type = repayment_type
+                    elif repayment_type != other_repayment_type:
+                        other_repayment_type = ''
                 
                 if rate_value and isinstance(rate_value, (int, float)):
                     rate_str = f"{rate_value:.2f}%"
@@ -127,85 +259,27 @@ class ImprovedCDRScraper:
         except Exception as e:
             logger.warning(f"Error extracting rates: {e}")
         
-        return rates
+        return (
+            rates,
+            self.loan_purpose_label(purpose_mask, other_purpose),
+            self.repayment_type_label(repayment_mask, other_repayment_type)
+        )
     
-    def extract_loan_purpose_improved(self, product: Dict[str, Any]) -> str:
-        """Extract loan purpose from rate.purpose field"""
-        try:
-            rate_data = product.get('rate', [])
-            purposes = set()
-            
-            for rate in rate_data:
-                purpose = rate.get('purpose', '').upper()
-                if purpose:
-                    purposes.add(purpose)
-            
-            if not purposes:
-                return "Not Specified"
-            elif len(purposes) == 1:
-                purpose = list(purposes)[0]
-                if purpose == 'INVESTMENT':
-                    return "Investment"
-                elif purpose == 'OWNER_OCCUPIED':
-                    return "Owner Occupier"
-                else:
-                    return purpose.title()
-            else:
-                # Multiple purposes found
-                has_investment = 'INVESTMENT' in purposes
-                has_owner_occ = 'OWNER_OCCUPIED' in purposes
-                
-                if has_investment and has_owner_occ:
-                    return "Both"
-                elif has_investment:
-                    return "Investment"
-                elif has_owner_occ:
-                    return "Owner Occupier"
-                else:
-                    return "Both"
-                    
-        except Exception as e:
-            logger.warning(f"Error extracting loan purpose: {e}")
-            return "Not Specified"
+    def loan_purpose_label(self, purpose_mask: int, other_purpose: Optional[str]) -> str:
+        """Summarise the CDR purposes seen on a product's rates"""
+        if purpose_mask or other_purpose is None:
+            return PURPOSE_LABELS[purpose_mask]
+        
+        # Only unrecognised purposes - show a single one as-is
+        return sys.intern(other_purpose.title()) if other_purpose else "Both"
     
-    def extract_repayment_type_improved(self, product: Dict[str, Any]) -> str:
-        """Extract repayment type from rate.repaymentType field"""
-        try:
-            rate_data = product.get('rate', [])
-            repayment_types = set()
-            
-            for rate in rate_data:
-                repayment_type = rate.get('repaymentType', '').upper()
-                if repayment_type:
-                    repayment_types.add(repayment_type)
-            
-            if not repayment_types:
-                return "Not Specified"
-            elif len(repayment_types) == 1:
-                repayment_type = list(repayment_types)[0]
-                if repayment_type == 'PRINCIPAL_AND_INTEREST':
-                    return "Principal and Interest"
-                elif repayment_type == 'INTEREST_ONLY':
-                    return "Interest Only"
-                else:
-                    return repayment_type.replace('_', ' ').title()
-            else:
-                # Multiple repayment types found
-                has_pi = 'PRINCIPAL_AND_INTEREST' in repayment_types
-                has_io = 'INTEREST_ONLY' in repayment_types
-                
-                if has_pi and has_io:
-                    return "Both"
-                elif has_pi:
-                    return "Principal and Interest"
-                elif has_io:
-                    return "Interest Only"
-                else:
-                    return "Both"
-                    
-        except Exception as e:
-            logger.warning(f"Error extracting repayment type: {e}")
-            return "Not Specified"
+    def repayment_type_label(self, repayment_mask: int, other_repayment_type: Optional[str]) -> str:
+        """Summarise the CDR repayment types seen on a product's rates"""
+        if repayment_mask or other_repayment_type is None:
+            return REPAYMENT_LABELS[repayment_mask]
+        
+        # Only unrecognised repayment types - show a single one as-is
+        return sys.intern(other_repayment_type.replace('_', ' ').title()) if other_repayment_type else "Both"
     
     def extract_features_improved(self, product: Dict[str, Any]) -> Dict[str, str]:
         """Extract features from direct offset/redraw fields"""
@@ -237,14 +311,16 @@ class ImprovedCDRScraper:
             product_name = product.get('productName', '').lower()
             brand_name = product.get('brandName', '').lower()
             
-            if any(word in product_name or word in brand_name for word in ['package', 'premium', 'advantage']):
-                feature_list.append('Package Product')
+            # Bit n-1 is set when keyword group n matched; only package
+            # keywords count when they appear in the brand name
+            found = 0
+            for match in FEATURE_KEYWORD_PATTERN.finditer(f"{product_name}\n{brand_name}"):
+                if match.lastindex == 1 or match.start() < len(product_name):
+                    found |= 1 << (match.lastindex - 1)
             
-            if any(word in product_name for word in ['construction', 'building']):
-                feature_list.append('Construction Loan')
-                
-            if any(word in product_name for word in ['split', 'portion']):
-                feature_list.append('Split Loan Option')
+            for bit, label in enumerate(FEATURE_KEYWORD_LABELS):
+                if found >> bit & 1:
+                    feature_list.append(label)
             
             features['features_summary'] = ' | '.join(feature_list) if feature_list else ''
             
@@ -269,81 +345,85 @@ class ImprovedCDRScraper:
                        rates.get('fixed_rate_3yr'))
             
             if rate_str and '%' in rate_str:
-                annual_rate = float(rate_str.replace('%', '')) / 100
-                monthly_rate = annual_rate / 12
-                n_payments = 30 * 12  # 30 years
+                # Rates are formatted to 2 decimal places, so there are only a
+                # few hundred distinct basis-point values to compute factors for
+                rate_bp = round(float(rate_str.replace('%', '')) * 100)
                 
-                loan_amounts = [300000, 500000, 750000]
-                repayment_keys = ['monthly_repayment_300k', 'monthly_repayment_500k', 'monthly_repayment_750k']
-                
-                for loan_amount, key in zip(loan_amounts, repayment_keys):
-                    if monthly_rate > 0:
-                        monthly_payment = loan_amount * (monthly_rate * (1 + monthly_rate)**n_payments) / ((1 + monthly_rate)**n_payments - 1)
-                        repayments[key] = f"${monthly_payment:,.0f}"
+                if rate_bp > 0:
+                    (repayments['monthly_repayment_300k'],
+                     repayments['monthly_repayment_500k'],
+                     repayments['monthly_repayment_750k']) = monthly_repayments(rate_bp)
             
         except Exception as e:
             logger.warning(f"Error calculating repayments: {e}")
         
         return repayments
     
-    def process_products_improved(self, products: List[Dict[str, Any]]) -> List[ImprovedHomeLoanProduct]:
-        """Process products with improved feature extraction"""
+    def process_product(self, product: Dict[str, Any]) -> ImprovedHomeLoanProduct:
+        """Convert one feed product with improved feature extraction"""
+        # Extract basic info - brand fields repeat across a bank's products,
+        # so intern them to share one string per brand
+        brand_id = intern_text(product.get('brandId', ''))
+        brand_name = intern_text(product.get('brandName', f'Brand-{brand_id}'))
+        product_id = product.get('productId', '')
+        product_name = product.get('productName', 'Unnamed Product')
+        
+        # Extract rates, loan purpose and repayment type (the key fix!)
+        rates, loan_purpose, repayment_type = self.extract_rate_derived_fields(product)
+        
+        # Extract features (the other key fix!)
+        features = self.extract_features_improved(product)
+        
+        # Calculate repayments
+        repayments = self.calculate_repayments_improved(rates)
+        
+        return ImprovedHomeLoanProduct(
+            brand_id=brand_id,
+            brand_name=brand_name,
+            product_id=product_id,
+            product_name=product_name,
+            description=sys.intern(f"Product from {brand_name}"),
+            variable_rate=rates['variable_rate'],
+            fixed_rate_1yr=rates['fixed_rate_1yr'],
+            fixed_rate_2yr=rates['fixed_rate_2yr'],
+            fixed_rate_3yr=rates['fixed_rate_3yr'],
+            fixed_rate_4yr=rates['fixed_rate_4yr'],
+            fixed_rate_5yr=rates['fixed_rate_5yr'],
+            comparison_rate=rates['comparison_rate'],
+            loan_purpose=loan_purpose,  # Now properly extracted!
+            repayment_type=repayment_type,  # Now properly extracted!
+            offset_available=features['offset_available'],  # Now properly extracted!
+            redraw_available=features['redraw_available'],  # Now properly extracted!
+            application_fee='',
+            annual_fee='',
+            exit_fee='',
+            other_fees='',
+            features_summary=features['features_summary'],
+            application_url='',
+            last_updated='',
+            monthly_repayment_300k=repayments['monthly_repayment_300k'],
+            monthly_repayment_500k=repayments['monthly_repayment_500k'],
+            monthly_repayment_750k=repayments['monthly_repayment_750k']
+        )
+    
+    def process_products_improved(self, products: Iterable[Dict[str, Any]]) -> List[ImprovedHomeLoanProduct]:
+        """Process products with improved feature extraction
+        
+        products may be a list or a stream of product dicts.
+        """
         processed_products = []
+        total = f"/{len(products)}" if isinstance(products, list) else ""
+        
+        # Bind the per-product calls to locals once, outside the hot loop
+        append = processed_products.append
+        process_product = self.process_product
         
         for i, product in enumerate(products):
             try:
                 if i % 100 == 0:
-                    logger.info(f"Processing product {i+1}/{len(products)}")
-                
-                # Extract basic info
-                brand_id = product.get('brandId', '')
-                brand_name = product.get('brandName', f'Brand-{brand_id}')
-                product_id = product.get('productId', '')
-                product_name = product.get('productName', 'Unnamed Product')
-                
-                # Extract rates
-                rates = self.extract_rates_improved(product)
-                
-                # Extract loan purpose and repayment type (the key fix!)
-                loan_purpose = self.extract_loan_purpose_improved(product)
-                repayment_type = self.extract_repayment_type_improved(product)
-                
-                # Extract features (the other key fix!)
-                features = self.extract_features_improved(product)
+                    logger.info(f"Processing product {i+1}{total}")
                 
-                # Calculate repayments
-                repayments = self.calculate_repayments_improved(rates)
-                
-                improved_product = ImprovedHomeLoanProduct(
-                    brand_id=brand_id,
-                    brand_name=brand_name,
-                    product_id=product_id,
-                    product_name=product_name,
-                    description=f"Product from {brand_name}",
-                    variable_rate=rates['variable_rate'],
-                    fixed_rate_1yr=rates['fixed_rate_1yr'],
-                    fixed_rate_2yr=rates['fixed_rate_2yr'],
-                    fixed_rate_3yr=rates['fixed_rate_3yr'],
-                    fixed_rate_4yr=rates['fixed_rate_4yr'],
-                    fixed_rate_5yr=rates['fixed_rate_5yr'],
-                    comparison_rate=rates['comparison_rate'],
-                    loan_purpose=loan_purpose,  # Now properly extracted!
-                    repayment_type=repayment_type,  # Now properly extracted!
-                    offset_available=features['offset_available'],  # Now properly extracted!
-                    redraw_available=features['redraw_available'],  # Now properly extracted!
-                    application_fee='',
-                    annual_fee='',
-                    exit_fee='',
-                    other_fees='',
-                    features_summary=features['features_summary'],
-                    application_url='',
-                    last_updated='',
-                    monthly_repayment_300k=repayments['monthly_repayment_300k'],
-                    monthly_repayment_500k=repayments['monthly_repayment_500k'],
-                    monthly_repayment_750k=repayments['monthly_repayment_750k']
-                )
-                
-                processed_products.append(improved_product)
+                append(process_product(product))
                 
             except Exception as e:
                 logger.warning(f"Error processing product {i}: {e}")
@@ -351,18 +431,69 @@ class ImprovedCDRScraper:
         
         return processed_products
     
-    def scrape_improved_data(self) -> List[ImprovedHomeLoanProduct]:
-        """Main method with improved extraction"""
+    def save_feed_cache(self, raw: bytes, etag: Optional[str]):
+        """Persist the mortgage feed and its ETag for conditional requests next run"""
+        if not etag:
+            return
+        
         try:
+            MORTGAGE_FEED_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            MORTGAGE_FEED_CACHE_PATH.write_bytes(raw)
+            MORTGAGE_FEED_ETAG_PATH.write_text(etag, encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not write mortgage feed cache: {e}")
+    
+    def stream_mortgage_data(self) -> Iterator[Dict[str, Any]]:
+        """Yield residential mortgage products one at a time as the feed downloads"""
+        logger.info("Streaming mortgage data in low-memory mode...")
+        with self.session.get(self.residential_mortgages_url, timeout=60, stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'item', use_float=True)
+    
+    def process_products_parallel(self, products: Iterable[Dict[str, Any]]) -> List[ImprovedHomeLoanProduct]:
+        """Process products in chunks across a pool of worker processes"""
+        products = iter(products)
+        chunks = iter(lambda: list(itertools.islice(products, PROCESS_CHUNK_SIZE)), [])
+        chunk_starts = itertools.count(0, PROCESS_CHUNK_SIZE)
+        processed_products = []
+        
+        with ProcessPoolExecutor(initializer=init_worker_scraper) as executor:
+            for chunk_products in executor.map(process_product_chunk, chunk_starts, chunks):
+                processed_products.extend(chunk_products)
+                logger.info(f"Processed {len(processed_products)} products so far")
+        
+        return processed_products
+    
+    def scrape_improved_data(self, low_memory: bool = False, parallel: bool = False) -> List[ImprovedHomeLoanProduct]:
+        """Main method with improved extraction
+        
+        With low_memory=True the feed is parsed incrementally with ijson, so
+        the raw product list is never held in memory at once. This is slower
+        than the default orjson path. With parallel=True products are
+        processed on all CPU cores, which only pays off for large feeds.
+        """
+        try:
+            if low_memory and ijson is None:
+                logger.warning("ijson is not installed - falling back to loading the full feed")
+                low_memory = False
+            
             # Fetch data
-            products = self.fetch_mortgage_data()
+            products = self.stream_mortgage_data() if low_memory else self.fetch_mortgage_data()
             
-            if not products:
+            if not low_memory and not products:
                 logger.error("No products found")
                 return []
             
             # Process with improved extraction
-            processed_products = self.process_products_improved(products)
+            if parallel:
+                processed_products = self.process_products_parallel(products)
+            else:
+                processed_products = self.process_products_improved(products)
+            
+            if not processed_products:
+                logger.error("No products found")
+                return []
             
             self.all_products = processed_products
             logger.info(f"Successfully processed {len(processed_products)} products with improved features")
@@ -384,51 +515,14 @@ class ImprovedCDRScraper:
                 logger.warning("No products to save")
                 return filename
             
-            # CSV fieldnames
-            fieldnames = [
-                'Brand ID', 'Brand Name', 'Product ID', 'Product Name', 'Description',
-                'Variable Rate', 'Fixed Rate 1Yr', 'Fixed Rate 2Yr', 'Fixed Rate 3Yr', 
-                'Fixed Rate 4Yr', 'Fixed Rate 5Yr', 'Comparison Rate',
-                'Loan Purpose', 'Repayment Type', 'Offset Available', 'Redraw Available',
-                'Application Fee', 'Annual Fee', 'Exit Fee', 'Other Fees', 'Features',
-                'Application URL', 'Last Updated', 'Monthly Repayment 300K',
-                'Monthly Repayment 500K', 'Monthly Repayment 750K'
-            ]
+            # Render the whole CSV in memory, then hand it to the file in one write
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(CSV_HEADER)
+            writer.writerows(map(CSV_ROW, self.all_products))
             
             with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-                
-                for product in self.all_products:
-                    row = {
-                        'Brand ID': product.brand_id,
-                        'Brand Name': product.brand_name,
-                        'Product ID': product.product_id,
-                        'Product Name': product.product_name,
-                        'Description': product.description,
-                        'Variable Rate': product.variable_rate,
-                        'Fixed Rate 1Yr': product.fixed_rate_1yr,
-                        'Fixed Rate 2Yr': product.fixed_rate_2yr,
-                        'Fixed Rate 3Yr': product.fixed_rate_3yr,
-                        'Fixed Rate 4Yr': product.fixed_rate_4yr,
-                        'Fixed Rate 5Yr': product.fixed_rate_5yr,
-                        'Comparison Rate': product.comparison_rate,
-                        'Loan Purpose': product.loan_purpose,
-                        'Repayment Type': product.repayment_type,
-                        'Offset Available': product.offset_available,
-                        'Redraw Available': product.redraw_available,
-                        'Application Fee': product.application_fee,
-                        'Annual Fee': product.annual_fee,
-                        'Exit Fee': product.exit_fee,
-                        'Other Fees': product.other_fees,
-                        'Features': product.features_summary,
-                        'Application URL': product.application_url,
-                        'Last Updated': product.last_updated,
-                        'Monthly Repayment 300K': product.monthly_repayment_300k,
-                        'Monthly Repayment 500K': product.monthly_repayment_500k,
-                        'Monthly Repayment 750K': product.monthly_repayment_750k
-                    }
-                    writer.writerow(row)
+                csvfile.write(buffer.getvalue())
             
             # Generate improved statistics
             self.print_improved_statistics(filename)
@@ -446,56 +540,79 @@ class ImprovedCDRScraper:
         print(f"📊 Total Products: {len(self.all_products)}")
         print(f"💾 Data saved to: {filename}")
         
-        # Loan purpose statistics
-        loan_purposes = {}
+        # Tally every statistic in a single pass over the products
+        loan_purposes = Counter()
+        repayment_types = Counter()
+        with_offset = with_redraw = with_features = with_variable = with_fixed = 0
         for product in self.all_products:
-            purpose = product.loan_purpose
-            loan_purposes[purpose] = loan_purposes.get(purpose, 0) + 1
+            loan_purposes[product.loan_purpose] += 1
+            repayment_types[product.repayment_type] += 1
+            with_offset += product.offset_available == 'Y'
+            with_redraw += product.redraw_available == 'Y'
+            with_features += bool(product.features_summary)
+            with_variable += bool(product.variable_rate)
+            with_fixed += bool(product.fixed_rate_1yr or product.fixed_rate_2yr or product.fixed_rate_3yr
+                               or product.fixed_rate_4yr or product.fixed_rate_5yr)
         
         print(f"\n🏠 Loan Purpose Distribution:")
         for purpose, count in sorted(loan_purposes.items()):
             percentage = count / len(self.all_products) * 100
             print(f"   • {purpose}: {count} ({percentage:.1f}%)")
         
-        # Repayment type statistics
-        repayment_types = {}
-        for product in self.all_products:
-            rep_type = product.repayment_type
-            repayment_types[rep_type] = repayment_types.get(rep_type, 0) + 1
-        
         print(f"\n💳 Repayment Type Distribution:")
         for rep_type, count in sorted(repayment_types.items()):
             percentage = count / len(self.all_products) * 100
             print(f"   • {rep_type}: {count} ({percentage:.1f}%)")
         
-        # Feature statistics
-        with_offset = len([p for p in self.all_products if p.offset_available == 'Y'])
-        with_redraw = len([p for p in self.all_products if p.redraw_available == 'Y'])
-        with_features = len([p for p in self.all_products if p.features_summary])
-        
         print(f"\n✨ Feature Coverage:")
         print(f"   • Offset accounts: {with_offset} ({with_offset/len(self.all_products)*100:.1f}%)")
         print(f"   • Redraw facility: {with_redraw} ({with_redraw/len(self.all_products)*100:.1f}%)")
         print(f"   • Products with features: {with_features} ({with_features/len(self.all_products)*100:.1f}%)")
         
-        # Rate statistics
-        with_variable = len([p for p in self.all_products if p.variable_rate])
-        with_fixed = len([p for p in self.all_products if any([p.fixed_rate_1yr, p.fixed_rate_2yr, p.fixed_rate_3yr, p.fixed_rate_4yr, p.fixed_rate_5yr])])
-        
         print(f"\n📈 Rate Coverage:")
         print(f"   • Variable rates: {with_variable} ({with_variable/len(self.all_products)*100:.1f}%)")
         print(f"   • Fixed rates: {with_fixed} ({with_fixed/len(self.all_products)*100:.1f}%)")
 
+# Scraper each --parallel worker process uses for all of its chunks
+worker_scraper = None
+
+def init_worker_scraper():
+    """Create a worker process's scraper once, when the pool starts it"""
+    global worker_scraper
+    worker_scraper = ImprovedCDRScraper()
+
+def process_product_chunk(chunk_start: int, products: List[Dict[str, Any]]) -> List[ImprovedHomeLoanProduct]:
+    """Process one chunk of feed products in a worker process
+    
+    chunk_start is the chunk's offset in the feed, so warnings give each
+    product's position in the whole feed rather than in its chunk.
+    """
+    processed_products = []
+    for i, product in enumerate(products, chunk_start):
+        try:
+            processed_products.append(worker_scraper.process_product(product))
+        except Exception as e:
+            logger.warning(f"Error processing product {i}: {e}")
+    return processed_products
+
 def main():
     """Main function with improved extraction"""
     print("🔧 IMPROVED Home Loan Feature Extractor")
     print("Fixing offset, redraw, loan purpose, and repayment type detection")
     print("=" * 65)
     
+    parser = argparse.ArgumentParser(description='Improved Home Loan Feature Extractor')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--low-memory', action='store_true',
+                      help='Stream-parse the mortgage feed with ijson instead of loading it whole')
+    mode.add_argument('--parallel', action='store_true',
+                      help='Process products across all CPU cores')
+    args = parser.parse_args()
+    
     scraper = ImprovedCDRScraper()
     
     try:
-        products = scraper.scrape_improved_data()
+        products = scraper.scrape_improved_data(low_memory=args.low_memory, parallel=args.parallel)
         
         if products:
             filename = scraper.save_improved_csv()
@@ -7,6 +7,15 @@ import json
 import requests
 from pprint import pprint
 
+# Fastest available JSON parser - all three accept the raw response bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    try:
+        from ujson import loads as json_loads
+    except ImportError:
+        json_loads = json.loads
+
 def investigate_open_banking_data():
     """Investigate the actual structure of Open Banking Tracker data"""
     
@@ -16,7 +25,7 @@ def investigate_open_banking_data():
     try:
         response = requests.get(url, timeout=30)
         if response.status_code == 200:
-            data = response.json()
+            data = json_loads(response.content)
             
             print(f"Total products: {len(data)}")
             print("\n=== SAMPLE PRODUCT STRUCTURE ===")
@@ -65,7 +74,7 @@ def investigate_open_banking_data():
                     try:
                         detail_response = requests.get(detail_url, timeout=10)
                         if detail_response.status_code == 200:
-                            detail_data = detail_response.json()
+                            detail_data = json_loads(detail_response.content)
                             print("✅ Detailed data available!")
                             print(f"Detailed keys: {list(detail_data.keys())}")
                             
@@ -8,18 +8,30 @@ but with real-time data collection from ALL Australian banking institutions.
 This is what Luke built, but maintainable and real-time.
 """
 
+import argparse
 import json
 import csv
-import time
+import re
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from dataclasses import dataclass, fields, is_dataclass
+from operator import attrgetter, itemgetter
 import logging
 import concurrent.futures
 from pathlib import Path
 import threading
 import os
+from urllib.parse import urlparse
+
+# orjson encodes straight to bytes and is several times faster; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -28,7 +40,86 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Keep-alive pools: one per CDR host, enough connections per host for the
+# concurrent list and detail requests made against it
+HOST_POOLS = 64
+CONNECTIONS_PER_HOST = 32
+
+# Concurrent brand list requests; I/O bound, so well above the CPU count
+BRAND_WORKERS = 32
+
+# Concurrent product detail requests
+DETAIL_WORKERS = 16
+
+# Disk writers for per-product files, kept off the result-gathering loop
+IO_WORKERS = 4
+
+# x-v header values tried in order; '' sends no version header
+API_VERSIONS = ('3', '2', '1', '')
+
+# Per-request header dicts for each version, built once and shared read-only
+VERSION_HEADERS = {version: {'x-v': version} if version else {} for version in API_VERSIONS}
+
+# Products held in memory before --low-memory runs spool them to disk
+FLUSH_BATCH_SIZE = 500
+
+# (connect, read) timeouts: fail fast on dead hosts, stay patient with slow responses
+LIST_TIMEOUT = (3.05, 30)
+DETAIL_TIMEOUT = (3.05, 15)
+
+# Politeness limit on in-flight requests to any single bank's host
+MAX_REQUESTS_PER_HOST = 8
+
+# Case-insensitive keyword matchers, so product text is never re-cased
+MORTGAGE_KEYWORD_PATTERN = re.compile(r'RESIDENTIAL|MORTGAGE|HOME', re.IGNORECASE)
+FEATURE_KEYWORD_PATTERN = re.compile(r'(offset)|(redraw)', re.IGNORECASE)
+
+# ISO 8601 fixed-rate term; only the years and months count towards the
+# term, but week, day and time parts (e.g. P1Y0M0D, P3YT0S) are allowed
+PERIOD_PATTERN = re.compile(r'P(?:(\d+)Y)?(?:(\d+)M)?(?:\d+W)?(?:\d+D)?(?:T[\d.HMS]*)?')
+
+# CSV column lookups for the aggregated rate summary
+FIXED_RATE_COLUMNS = {
+    12: 'Fixed Rate 1Yr (%)',
+    24: 'Fixed Rate 2Yr (%)',
+    36: 'Fixed Rate 3Yr (%)',
+    48: 'Fixed Rate 4Yr (%)',
+    60: 'Fixed Rate 5Yr (%)',
+}
+PURPOSE_RATE_COLUMNS = {
+    'INVESTMENT': 'Investment Rate (%)',
+    'OWNER_OCCUPIED': 'Owner Occupier Rate (%)',
+}
+EMPTY_RATE_COLUMNS = dict.fromkeys(
+    ['Variable Rate (%)', *FIXED_RATE_COLUMNS.values(), *PURPOSE_RATE_COLUMNS.values()], ''
+)
+LOAN_PURPOSE_LABELS = {'INVESTMENT': 'Investment', 'OWNER_OCCUPIED': 'Owner Occupier'}
+REPAYMENT_TYPE_LABELS = {'PRINCIPAL_AND_INTEREST': 'Principal and Interest', 'INTEREST_ONLY': 'Interest Only'}
+
+def is_connect_failure(error: requests.exceptions.ConnectionError) -> bool:
+    """True if the host refused or never answered the connection, as opposed
+    to a reset, SSL or proxy error on an otherwise reachable host"""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], 'reason', None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+def json_default(value: Any) -> Any:
+    """Encode dataclasses as dicts and anything else unknown as a string"""
+    if is_dataclass(value):
+        # Shallow field copy; asdict would deep-copy every nested rate list
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+    return str(value)
+
+def write_json(path: Path, data: Any):
+    """Write data to path as indented JSON, serializing dataclasses directly"""
+    if orjson:
+        # orjson encodes dataclass instances natively, without a dict copy
+        path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        path.write_text(json.dumps(data, indent=2, default=json_default), encoding='utf-8')
+
+@dataclass(slots=True, frozen=True)
 class CDRBrand:
     """CDR Brand from the register"""
     brand_id: str
@@ -40,7 +131,7 @@ class CDRBrand:
     status: str
     last_updated: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RealTimeProduct:
     """Real-time product in Luke's format"""
     brandId: str
@@ -54,12 +145,19 @@ class RealTimeProduct:
     redraw: bool
     lastUpdated: str
     applicationUri: str
+
+# Field order and bulk getter for flattening RealTimeProduct into a dict
+PRODUCT_FIELDS = tuple(field.name for field in fields(RealTimeProduct))
+PRODUCT_VALUES = attrgetter(*PRODUCT_FIELDS)
     
 class LukePriorStyleTracker:
     """Replicates Luke Prior's tracking system with real-time data"""
     
-    def __init__(self, output_dir: str = "realtime_banking_tracker"):
+    def __init__(self, output_dir: str = "realtime_banking_tracker", max_workers: int = BRAND_WORKERS,
+                 low_memory: bool = False):
         self.output_dir = Path(output_dir)
+        self.max_workers = max_workers
+        self.low_memory = low_memory
         self.output_dir.mkdir(exist_ok=True)
         
         # Create directory structure like Luke's
@@ -70,9 +168,13 @@ class LukePriorStyleTracker:
         self.data_dir.mkdir(exist_ok=True)
         self.aggregate_dir.mkdir(exist_ok=True)
         self.residential_dir.mkdir(exist_ok=True)
+        self.spool_file = self.residential_dir / "data.jsonl"
         
         self.cdr_register_url = "https://api.cdr.gov.au/cdr-register/v1/banking/register"
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=HOST_POOLS, pool_maxsize=CONNECTIONS_PER_HOST)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         self.session.headers.update({
             'User-Agent': 'RealTime-Banking-Tracker/1.0 (Inspired-by-LukePrior)',
             'Accept': 'application/json'
@@ -80,8 +182,33 @@ class LukePriorStyleTracker:
         
         self.brands = []
         self.all_products = []
+        self.product_count = 0
+        self.product_stats = Counter()
+        self.brand_product_counts = Counter()
         self.errors = {}
         self.success_count = 0
+        self.host_semaphores = {}
+        self.host_versions = {}
+        self.unreachable_hosts = set()
+        
+        # One timestamp stamps every record from a run
+        self.run_timestamp = datetime.now().isoformat()
+    
+    def api_versions_for(self, host: str) -> List[str]:
+        """x-v header values to try against host, last accepted version first"""
+        preferred = self.host_versions.get(host)
+        if preferred is None:
+            return list(API_VERSIONS)
+        return [preferred] + [version for version in API_VERSIONS if version != preferred]
+    
+    def host_semaphore(self, url: str) -> threading.Semaphore:
+        """Semaphore bounding concurrent requests to the host serving url"""
+        host = urlparse(url).netloc
+        semaphore = self.host_semaphores.get(host)
+        if semaphore is None:
+            # setdefault is atomic, so racing threads end up sharing one semaphore
+            semaphore = self.host_semaphores.setdefault(host, threading.Semaphore(MAX_REQUESTS_PER_HOST))
+        return semaphore
         
     def fetch_cdr_register_comprehensive(self) -> List[CDRBrand]:
         """Fetch ALL brands from CDR register like Luke did"""
@@ -94,7 +221,7 @@ class LukePriorStyleTracker:
             try:
                 response = self.session.get(self.cdr_register_url, timeout=30)
                 if response.status_code == 200:
-                    register_data = response.json()
+                    register_data = orjson.loads(response.content) if orjson else response.json()
                     brands = self.parse_cdr_register(register_data)
                     if brands:
                         logger.info(f"✅ CDR register: {len(brands)} active banking brands")
@@ -117,23 +244,27 @@ class LukePriorStyleTracker:
     def parse_cdr_register(self, register_data: Dict[str, Any]) -> List[CDRBrand]:
         """Parse CDR register like Luke's system"""
         brands = []
+        banking_holders = [
+            data_holder for data_holder in register_data.get('data', [])
+            if data_holder.get('industry') == 'banking'
+        ]
         
-        for data_holder in register_data.get('data', []):
-            if data_holder.get('industry') != 'banking':
-                continue
-                
+        for data_holder in banking_holders:
             legal_entity_name = data_holder.get('legalEntityName', '')
             
             for brand in data_holder.get('dataHolderBrands', []):
-                brand_id = brand.get('brandId', '')
-                brand_name = brand.get('brandName', '')
-                status = brand.get('status', '')
-                last_updated = brand.get('lastUpdated', '')
-                
-                endpoint_detail = brand.get('endpointDetail', {})
-                public_base_uri = endpoint_detail.get('publicBaseUri', '')
+                # Brands without a status or public endpoint can't be queried
+                try:
+                    status = brand['status']
+                    public_base_uri = brand['endpointDetail']['publicBaseUri']
+                except (KeyError, TypeError):
+                    continue
                 
                 if public_base_uri and status.upper() == 'ACTIVE':
+                    brand_id = brand.get('brandId', '')
+                    brand_name = brand.get('brandName', '')
+                    last_updated = brand.get('lastUpdated', '')
+                    
                     # Construct products endpoint
                     if not public_base_uri.endswith('/'):
                         public_base_uri += '/'
@@ -176,7 +307,7 @@ class LukePriorStyleTracker:
             ("ING Australia", "54c53f2b-711e-eb11-a823-000d3a884a20", "https://banking.ing.com.au/cds-au/v1/banking/products"),
             ("Macquarie Bank", "1a74d5ba-3c96-eb11-a823-000d3a884a20", "https://digital.macquarie.com.au/cds-au/v1/banking/products"),
             ("Up Bank", "ed29ea8b-b497-4fb9-9c8b-8cf3cbd32d6b", "https://api.up.com.au/cds-au/v1/banking/products"),
-            ("Ubank", "ubank-brand-id-123", "https://api.ubank.com.au/cds-au/v1/banking/products")
+            ("Ubank", "ubank-brand-id-123", "https://api.ubank.com.au/cds-au/v1/banking/products"),
             
             # Building Societies
             ("Heritage Bank", "1f14b2b7-ddc7-ea11-a828-000d3a8842e2", "https://www.heritage.com.au/cds-au/v1/banking/products"),
@@ -199,7 +330,7 @@ class LukePriorStyleTracker:
                 public_base_uri=endpoint.replace('/cds-au/v1/banking/products', ''),
                 products_endpoint=endpoint,
                 status='ACTIVE',
-                last_updated=datetime.now().isoformat()
+                last_updated=self.run_timestamp
             ))
         
         return brands
@@ -209,24 +340,36 @@ class LukePriorStyleTracker:
         try:
             logger.info(f"🏦 {brand.brand_name}: Fetching products...")
             
-            # Try different API versions and endpoints
+            # Try different API versions, starting with whichever this host last accepted
+            endpoint = brand.products_endpoint
+            host = urlparse(endpoint).netloc
             attempts = [
-                {'headers': {'x-v': '3'}, 'url': brand.products_endpoint},
-                {'headers': {'x-v': '2'}, 'url': brand.products_endpoint}, 
-                {'headers': {'x-v': '1'}, 'url': brand.products_endpoint},
-                {'headers': {}, 'url': brand.products_endpoint},
-                # Alternative endpoint patterns
-                {'headers': {'x-v': '3'}, 'url': brand.products_endpoint.replace('/v1/', '/v3/')},
-                {'headers': {'x-v': '2'}, 'url': brand.products_endpoint.replace('/v1/', '/v2/')},
+                {'headers': VERSION_HEADERS[version], 'url': endpoint}
+                for version in self.api_versions_for(host)
             ]
+            # Alternative endpoint patterns, only worth trying if the /v1/ path is missing
+            alternative_attempts = [
+                {'headers': VERSION_HEADERS['3'], 'url': endpoint.replace('/v1/', '/v3/')},
+                {'headers': VERSION_HEADERS['2'], 'url': endpoint.replace('/v1/', '/v2/')},
+            ]
+            
+            if host in self.unreachable_hosts:
+                attempts = []
             
             for attempt in attempts:
                 try:
-                    response = self.session.get(
-                        attempt['url'], 
-                        headers=attempt['headers'], 
-                        timeout=30
-                    )
+                    with self.host_semaphore(attempt['url']):
+                        response = self.session.get(
+                            attempt['url'], 
+                            headers=attempt['headers'], 
+                            timeout=LIST_TIMEOUT
+                        )
+                    
+                    if response.status_code == 404 and attempt['url'] == endpoint:
+                        attempts.extend(
+                            alternative for alternative in alternative_attempts
+                            if alternative['url'] != endpoint and alternative not in attempts
+                        )
                     
                     if response.status_code == 200:
                         data = response.json()
@@ -234,14 +377,14 @@ class LukePriorStyleTracker:
                         
                         if products:
                             # Filter for residential mortgages
-                            mortgage_products = []
-                            for product in products:
-                                category = product.get('productCategory', '').upper()
-                                name = product.get('name', '').upper()
-                                
-                                if any(keyword in category or keyword in name for keyword in 
-                                      ['RESIDENTIAL', 'MORTGAGE', 'HOME']):
-                                    mortgage_products.append(product)
+                            is_mortgage = MORTGAGE_KEYWORD_PATTERN.search
+                            mortgage_products = [
+                                product for product in products
+                                if is_mortgage(product.get('productCategory', ''))
+                                or is_mortgage(product.get('name', ''))
+                            ]
+                            
+                            self.host_versions[host] = attempt['headers'].get('x-v', '')
                             
                             if mortgage_products:
                                 logger.info(f"✅ {brand.brand_name}: {len(mortgage_products)} mortgage products")
@@ -251,6 +394,12 @@ class LukePriorStyleTracker:
                                 logger.info(f"ℹ️  {brand.brand_name}: {len(products)} products (no mortgages)")
                                 return []
                     
+                except requests.exceptions.ConnectionError as e:
+                    if is_connect_failure(e):
+                        # Every other version and path lives on the same unreachable host
+                        self.unreachable_hosts.add(host)
+                        break
+                    continue
                 except requests.exceptions.RequestException:
                     continue
             
@@ -271,14 +420,23 @@ class LukePriorStyleTracker:
         try:
             detail_url = f"{brand.products_endpoint}/{product_id}"
             
-            for version in ['3', '2', '1', '']:
+            host = urlparse(detail_url).netloc
+            if host in self.unreachable_hosts:
+                return {}
+            
+            for version in self.api_versions_for(host):
                 try:
-                    headers = {'x-v': version} if version else {}
-                    response = self.session.get(detail_url, headers=headers, timeout=15)
+                    with self.host_semaphore(detail_url):
+                        response = self.session.get(detail_url, headers=VERSION_HEADERS[version], timeout=DETAIL_TIMEOUT)
                     
                     if response.status_code == 200:
                         return response.json().get('data', {})
                         
+                except requests.exceptions.ConnectionError as e:
+                    if is_connect_failure(e):
+                        self.unreachable_hosts.add(host)
+                        break
+                    continue
                 except:
                     continue
                     
@@ -288,6 +446,11 @@ class LukePriorStyleTracker:
             logger.debug(f"Could not fetch details for {product_id}: {e}")
             return {}
     
+    def fetch_luke_product(self, brand: CDRBrand, product: Dict[str, Any]) -> RealTimeProduct:
+        """Fetch a product's details and convert it, all on the worker thread"""
+        detailed_data = self.fetch_detailed_product_data(brand, product.get('productId', ''))
+        return self.convert_to_luke_format(product, brand, detailed_data)
+    
     def convert_to_luke_format(self, product: Dict[str, Any], brand: CDRBrand, detailed_data: Dict[str, Any] = None) -> RealTimeProduct:
         """Convert product to Luke Prior's exact format"""
         
@@ -313,42 +476,33 @@ class LukePriorStyleTracker:
             
             # Add period for fixed rates
             additional_value = rate.get('additionalValue', '')
-            if additional_value and 'P' in additional_value:
-                # Convert ISO period to months
-                if 'P1Y' in additional_value:
-                    rate_entry['period'] = 12
-                elif 'P2Y' in additional_value:
-                    rate_entry['period'] = 24
-                elif 'P3Y' in additional_value:
-                    rate_entry['period'] = 36
-                elif 'P4Y' in additional_value:
-                    rate_entry['period'] = 48  
-                elif 'P5Y' in additional_value:
-                    rate_entry['period'] = 60
+            if additional_value:
+                # Convert ISO 8601 period (e.g. P3Y, P18M, P1Y6M) to months
+                match = PERIOD_PATTERN.fullmatch(additional_value.strip())
+                if match:
+                    years, months = match.groups()
+                    period = int(years or 0) * 12 + int(months or 0)
+                    if period:
+                        rate_entry['period'] = period
             
             rates.append(rate_entry)
         
-        # Extract features
+        # Extract features from the detail feature list and the product
+        # name/description in one scan over all of the text
+        text_parts = [f"{product.get('name', '')}\n{product.get('description', '')}"]
+        if detailed_data:
+            for feature in detailed_data.get('features', []):
+                text_parts.append(f"{feature.get('featureType', '')}\n{feature.get('description', '')}")
+        
         offset = False
         redraw = False
-        
-        if detailed_data:
-            features = detailed_data.get('features', [])
-            for feature in features:
-                feature_type = feature.get('featureType', '').upper()
-                description = feature.get('description', '').lower()
-                
-                if 'OFFSET' in feature_type or 'offset' in description:
-                    offset = True
-                if 'REDRAW' in feature_type or 'redraw' in description:
-                    redraw = True
-        
-        # Also check product name/description for features
-        product_text = f"{product.get('name', '')} {product.get('description', '')}".lower()
-        if 'offset' in product_text:
-            offset = True
-        if 'redraw' in product_text:
-            redraw = True
+        for match in FEATURE_KEYWORD_PATTERN.finditer('\n'.join(text_parts)):
+            if match.lastindex == 1:
+                offset = True
+            else:
+                redraw = True
+            if offset and redraw:
+                break
         
         return RealTimeProduct(
             brandId=brand.brand_id,
@@ -360,7 +514,7 @@ class LukePriorStyleTracker:
             rate=rates,
             offset=offset,
             redraw=redraw,
-            lastUpdated=datetime.now().isoformat(),
+            lastUpdated=self.run_timestamp,
             applicationUri=product.get('applicationUri', '')
         )
     
@@ -369,75 +523,157 @@ class LukePriorStyleTracker:
         logger.info(f"🚀 Processing {len(self.brands)} brands in parallel...")
         
         all_products = []
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
+        # (brand position, product position) of each entry in all_products
+        product_positions = []
+        self.product_count = 0
+        self.product_stats.clear()
+        self.brand_product_counts.clear()
+        if self.low_memory:
+            self.spool_file.unlink(missing_ok=True)
+        
+        # Detail requests get their own pool so they never wait behind brand list fetches
+        brand_workers = max(1, min(self.max_workers, len(self.brands)))
+        save_futures = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=brand_workers) as executor, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as detail_executor, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=IO_WORKERS) as io_executor:
             # Submit all brand requests
             future_to_brand = {
-                executor.submit(self.fetch_bank_products_robust, brand): brand 
-                for brand in self.brands
+                executor.submit(self.fetch_bank_products_robust, brand): (brand_position, brand)
+                for brand_position, brand in enumerate(self.brands)
             }
+            detail_futures = {}
+            pending = set(future_to_brand)
             
-            # Process results as they complete
-            for future in concurrent.futures.as_completed(future_to_brand):
-                brand = future_to_brand[future]
+            # Single stream of results: product details are requested as soon as
+            # a brand's list arrives and converted as soon as each detail arrives
+            while pending:
+                done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+                converted = []
                 
-                try:
-                    products = future.result()
+                for future in done:
+                    if future in detail_futures:
+                        brand, position = detail_futures.pop(future)
+                        try:
+                            converted.append(future.result())
+                            product_positions.append(position)
+                        except Exception as e:
+                            error_msg = f"Error processing: {e}"
+                            logger.error(f"❌ {brand.brand_name}: {error_msg}")
+                            self.errors[brand.brand_name] = error_msg
+                        continue
                     
-                    # Convert each product to Luke's format
-                    for product in products:
-                        # Get detailed data for better rates/features
-                        detailed_data = self.fetch_detailed_product_data(brand, product.get('productId', ''))
-                        
-                        # Convert to Luke's format
-                        luke_product = self.convert_to_luke_format(product, brand, detailed_data)
-                        all_products.append(luke_product)
-                    
-                    # Save individual brand data (like Luke did)
-                    if products:
-                        self.save_brand_data(brand, products)
-                    
-                    # Rate limiting
-                    time.sleep(0.5)
+                    brand_position, brand = future_to_brand[future]
                     
+                    try:
+                        products = future.result()
+                        
+                        # Get detailed data for better rates/features - all of the
+                        # brand's products at once rather than one round-trip each
+                        for product_position, product in enumerate(products):
+                            detail_future = detail_executor.submit(self.fetch_luke_product, brand, product)
+                            detail_futures[detail_future] = brand, (brand_position, product_position)
+                            pending.add(detail_future)
+                        
+                        # Save individual brand data (like Luke did) in the background
+                        if products:
+                            save_futures[io_executor.submit(self.save_brand_data, brand, products)] = brand
+                        
+                    except Exception as e:
+                        error_msg = f"Error processing: {e}"
+                        logger.error(f"❌ {brand.brand_name}: {error_msg}")
+                        self.errors[brand.brand_name] = error_msg
+                
+                all_products.extend(converted)
+                self.count_products(converted)
+                
+                # Cap memory by moving finished products to the on-disk spool
+                if self.low_memory and len(all_products) >= FLUSH_BATCH_SIZE:
+                    self.spool_products(all_products)
+                    all_products.clear()
+                    product_positions.clear()
+            
+            for future in concurrent.futures.as_completed(save_futures):
+                brand = save_futures[future]
+                try:
+                    future.result()
                 except Exception as e:
-                    error_msg = f"Error processing: {e}"
+                    error_msg = f"Error saving: {e}"
                     logger.error(f"❌ {brand.brand_name}: {error_msg}")
                     self.errors[brand.brand_name] = error_msg
         
+        if self.low_memory:
+            self.spool_products(all_products)
+            all_products.clear()
+            product_positions.clear()
+        
+        # Details finish in any order; restore brand order, and each brand's
+        # list order, so the outputs are stable from run to run
+        all_products = [product for _, product in sorted(zip(product_positions, all_products), key=itemgetter(0))]
         self.all_products = all_products
         return all_products
     
+    def count_products(self, products: List[RealTimeProduct]):
+        """Keep the run summary's statistics as products arrive"""
+        for product in products:
+            self.product_count += 1
+            self.brand_product_counts[product.brandName] += 1
+            if product.rate:
+                self.product_stats['rates'] += 1
+            if product.offset:
+                self.product_stats['offset'] += 1
+            if product.redraw:
+                self.product_stats['redraw'] += 1
+    
+    def spool_products(self, products: List[RealTimeProduct]):
+        """Append products to the JSON Lines spool, one product per line"""
+        if not products:
+            return
+        if orjson:
+            lines = b''.join(orjson.dumps(product) + b'\n' for product in products)
+        else:
+            lines = ''.join(json.dumps(product, default=json_default) + '\n' for product in products).encode('utf-8')
+        with open(self.spool_file, 'ab') as f:
+            f.write(lines)
+    
+    def iter_spooled_products(self) -> Iterator[Dict[str, Any]]:
+        """Read products back from the spool one at a time"""
+        if not self.spool_file.exists():
+            return
+        with open(self.spool_file, 'rb') as f:
+            for line in f:
+                yield orjson.loads(line) if orjson else json.loads(line)
+    
     def save_brand_data(self, brand: CDRBrand, products: List[Dict[str, Any]]):
         """Save individual brand data like Luke's system"""
+        brand_products = [product for product in products if product.get('productId', '')]
+        if not brand_products:
+            return
+        
+        # One array file per brand rather than one file per product
         brand_dir = self.data_dir / brand.brand_id
         brand_dir.mkdir(exist_ok=True)
-        
-        for product in products:
-            product_id = product.get('productId', '')
-            if product_id:
-                product_file = brand_dir / f"{product_id}.json"
-                with open(product_file, 'w') as f:
-                    json.dump(product, f, indent=2, default=str)
+        write_json(brand_dir / "products.json", brand_products)
     
     def create_luke_aggregated_data(self):
         """Create aggregated data files like Luke's system"""
         logger.info("📊 Creating aggregated data files (Luke Prior style)...")
         
-        # Convert to Luke's exact format for aggregation
-        luke_format_products = []
-        for product in self.all_products:
-            luke_format_products.append(asdict(product))
-        
-        # Save main aggregated file
-        aggregated_file = self.residential_dir / "data.json"
-        with open(aggregated_file, 'w') as f:
-            json.dump(luke_format_products, f, indent=2, default=str)
+        if self.low_memory:
+            # Products are already on disk; stream them into data.json and the CSV
+            self.write_spooled_json(self.residential_dir / "data.json")
+            luke_format_products = self.iter_spooled_products()
+        else:
+            # Save main aggregated file straight from the dataclasses
+            write_json(self.residential_dir / "data.json", self.all_products)
+            
+            # Convert to Luke's exact format for the CSV
+            luke_format_products = [dict(zip(PRODUCT_FIELDS, PRODUCT_VALUES(product))) for product in self.all_products]
         
         # Save metadata
         metadata = {
             'collection_date': datetime.now().isoformat(),
-            'total_products': len(luke_format_products),
+            'total_products': self.product_count,
             'total_brands_attempted': len(self.brands),
             'successful_brands': self.success_count,
             'failed_brands': len(self.errors),
@@ -446,17 +682,32 @@ class LukePriorStyleTracker:
             'luke_prior_compatible': True
         }
         
-        metadata_file = self.residential_dir / "metadata.json"
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2, default=str)
+        write_json(self.residential_dir / "metadata.json", metadata)
         
         # Create CSV version
         csv_file = self.residential_dir / "data.csv"
-        self.save_csv_aggregated(csv_file, luke_format_products)
+        if self.product_count:
+            self.save_csv_aggregated(csv_file, luke_format_products)
+        
+        if self.low_memory:
+            self.spool_file.unlink(missing_ok=True)
         
-        logger.info(f"✅ Aggregated data saved: {len(luke_format_products)} products")
+        logger.info(f"✅ Aggregated data saved: {self.product_count} products")
     
-    def save_csv_aggregated(self, filename: Path, products: List[Dict[str, Any]]):
+    def write_spooled_json(self, filename: Path):
+        """Concatenate the spooled product lines into a single JSON array"""
+        with open(filename, 'wb') as out:
+            out.write(b'[')
+            separator = b'\n'
+            if self.spool_file.exists():
+                with open(self.spool_file, 'rb') as spool:
+                    for line in spool:
+                        out.write(separator)
+                        out.write(line.rstrip(b'\n'))
+                        separator = b',\n'
+            out.write(b'\n]\n')
+    
+    def save_csv_aggregated(self, filename: Path, products: Iterable[Dict[str, Any]]):
         """Save CSV in user-friendly format"""
         if not products:
             return
@@ -471,95 +722,69 @@ class LukePriorStyleTracker:
         ]
         
         with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(self.csv_rows(products))
+    
+    def csv_rows(self, products: Iterable[Dict[str, Any]]) -> Iterator[tuple]:
+        """Yield one CSV row tuple per product, so rows are never all held at once"""
+        for product in products:
+            rate_columns = dict(EMPTY_RATE_COLUMNS)
+            purposes = set()
+            repayment_types = set()
             
-            for product in products:
-                rates = product.get('rate', [])
+            # One pass over the rates, dropping each into its column by lookup
+            for rate in product.get('rate', []):
+                rate_value = rate.get('rate', 0)
+                purpose = rate.get('purpose', '').upper()
+                repayment = rate.get('repaymentType', '').upper()
                 
-                # Extract different rate types
-                variable_rate = ""
-                fixed_rates = {"1yr": "", "2yr": "", "3yr": "", "4yr": "", "5yr": ""}
-                investment_rate = ""
-                owner_occ_rate = ""
-                purposes = set()
-                repayment_types = set()
-                
-                for rate in rates:
-                    rate_value = rate.get('rate', 0)
-                    rate_type = rate.get('lendingRateType', '').upper()
-                    purpose = rate.get('purpose', '').upper()
-                    repayment = rate.get('repaymentType', '').upper()
-                    period = rate.get('period', 0)
+                if rate_value:
+                    rate_pct = f"{float(rate_value) * 100:.2f}" if isinstance(rate_value, (int, float)) else str(rate_value)
                     
-                    if rate_value:
-                        rate_pct = f"{float(rate_value) * 100:.2f}" if isinstance(rate_value, (int, float)) else str(rate_value)
-                        
-                        if rate_type == 'VARIABLE':
-                            variable_rate = rate_pct
-                        elif rate_type == 'FIXED':
-                            if period == 12:
-                                fixed_rates["1yr"] = rate_pct
-                            elif period == 24:
-                                fixed_rates["2yr"] = rate_pct
-                            elif period == 36:
-                                fixed_rates["3yr"] = rate_pct
-                            elif period == 48:
-                                fixed_rates["4yr"] = rate_pct
-                            elif period == 60:
-                                fixed_rates["5yr"] = rate_pct
-                        
-                        if purpose == 'INVESTMENT':
-                            investment_rate = rate_pct
-                        elif purpose == 'OWNER_OCCUPIED':
-                            owner_occ_rate = rate_pct
+                    rate_type = rate.get('lendingRateType', '').upper()
+                    if rate_type == 'VARIABLE':
+                        rate_columns['Variable Rate (%)'] = rate_pct
+                    elif rate_type == 'FIXED':
+                        column = FIXED_RATE_COLUMNS.get(rate.get('period', 0))
+                        if column:
+                            rate_columns[column] = rate_pct
                     
-                    if purpose:
-                        purposes.add(purpose)
-                    if repayment:
-                        repayment_types.add(repayment)
-                
-                # Map purposes and repayment types
-                if len(purposes) > 1:
-                    loan_purpose = "Both"
-                elif 'INVESTMENT' in purposes:
-                    loan_purpose = "Investment"
-                elif 'OWNER_OCCUPIED' in purposes:
-                    loan_purpose = "Owner Occupier"
-                else:
-                    loan_purpose = "Not Specified"
-                
-                if len(repayment_types) > 1:
-                    repayment_type = "Both"
-                elif 'PRINCIPAL_AND_INTEREST' in repayment_types:
-                    repayment_type = "Principal and Interest"
-                elif 'INTEREST_ONLY' in repayment_types:
-                    repayment_type = "Interest Only"
-                else:
-                    repayment_type = "Not Specified"
+                    column = PURPOSE_RATE_COLUMNS.get(purpose)
+                    if column:
+                        rate_columns[column] = rate_pct
                 
-                row = {
-                    'Brand Name': product.get('brandName', ''),
-                    'Product ID': product.get('productId', ''),
-                    'Product Name': product.get('productName', ''),
-                    'Category': product.get('productCategory', ''),
-                    'Description': product.get('description', '')[:200] + "..." if len(product.get('description', '')) > 200 else product.get('description', ''),
-                    'Variable Rate (%)': variable_rate,
-                    'Fixed Rate 1Yr (%)': fixed_rates["1yr"],
-                    'Fixed Rate 2Yr (%)': fixed_rates["2yr"],
-                    'Fixed Rate 3Yr (%)': fixed_rates["3yr"],
-                    'Fixed Rate 4Yr (%)': fixed_rates["4yr"],
-                    'Fixed Rate 5Yr (%)': fixed_rates["5yr"],
-                    'Investment Rate (%)': investment_rate,
-                    'Owner Occupier Rate (%)': owner_occ_rate,
-                    'Loan Purpose': loan_purpose,
-                    'Repayment Type': repayment_type,
-                    'Offset Available': 'Y' if product.get('offset', False) else 'N',
-                    'Redraw Available': 'Y' if product.get('redraw', False) else 'N',
-                    'Application URL': product.get('applicationUri', ''),
-                    'Last Updated': product.get('lastUpdated', '')
-                }
-                writer.writerow(row)
+                if purpose:
+                    purposes.add(purpose)
+                if repayment:
+                    repayment_types.add(repayment)
+            
+            # Map purposes and repayment types
+            if len(purposes) > 1:
+                loan_purpose = "Both"
+            else:
+                loan_purpose = LOAN_PURPOSE_LABELS.get(next(iter(purposes), ''), "Not Specified")
+            
+            if len(repayment_types) > 1:
+                repayment_type = "Both"
+            else:
+                repayment_type = REPAYMENT_TYPE_LABELS.get(next(iter(repayment_types), ''), "Not Specified")
+            
+            description = product.get('description', '')
+            yield (
+                product.get('brandName', ''),
+                product.get('productId', ''),
+                product.get('productName', ''),
+                product.get('productCategory', ''),
+                description[:200] + "..." if len(description) > 200 else description,
+                *rate_columns.values(),  # EMPTY_RATE_COLUMNS keeps the CSV column order
+                loan_purpose,
+                repayment_type,
+                'Y' if product.get('offset', False) else 'N',
+                'Y' if product.get('redraw', False) else 'N',
+                product.get('applicationUri', ''),
+                product.get('lastUpdated', '')
+            )
     
     def run_luke_prior_tracker(self):
         """Run the complete Luke Prior style tracker"""
@@ -567,6 +792,7 @@ class LukePriorStyleTracker:
         logger.info("=" * 55)
         
         start_time = datetime.now()
+        self.run_timestamp = start_time.isoformat()
         
         try:
             # Step 1: Fetch all brands (like Luke's daily register fetch)
@@ -596,27 +822,22 @@ class LukePriorStyleTracker:
         print(f"⏱️  Collection time: {duration}")
         print(f"🏛️  Brands attempted: {len(self.brands)}")
         print(f"✅ Successful brands: {self.success_count}")
-        print(f"📊 Total mortgage products: {len(self.all_products)}")
+        print(f"📊 Total mortgage products: {self.product_count}")
         print(f"❌ Failed brands: {len(self.errors)}")
         
-        if self.all_products:
-            # Rate statistics
-            with_rates = len([p for p in self.all_products if p.rate])
-            with_offset = len([p for p in self.all_products if p.offset])
-            with_redraw = len([p for p in self.all_products if p.redraw])
+        if self.product_count:
+            # Rate statistics, counted as products arrived
+            with_rates = self.product_stats['rates']
+            with_offset = self.product_stats['offset']
+            with_redraw = self.product_stats['redraw']
             
             print(f"\n📈 Data Quality:")
-            print(f"   • Products with rates: {with_rates} ({with_rates/len(self.all_products)*100:.1f}%)")
-            print(f"   • Products with offset: {with_offset} ({with_offset/len(self.all_products)*100:.1f}%)")
-            print(f"   • Products with redraw: {with_redraw} ({with_redraw/len(self.all_products)*100:.1f}%)")
+            print(f"   • Products with rates: {with_rates} ({with_rates/self.product_count*100:.1f}%)")
+            print(f"   • Products with offset: {with_offset} ({with_offset/self.product_count*100:.1f}%)")
+            print(f"   • Products with redraw: {with_redraw} ({with_redraw/self.product_count*100:.1f}%)")
             
             print(f"\n🏦 Successful Banks:")
-            successful_brands = set()
-            for product in self.all_products:
-                successful_brands.add(product.brandName)
-            
-            for brand in sorted(successful_brands):
-                count = len([p for p in self.all_products if p.brandName == brand])
+            for brand, count in sorted(self.brand_product_counts.items()):
                 print(f"   • {brand}: {count} products")
         
         if self.errors:
@@ -630,7 +851,7 @@ class LukePriorStyleTracker:
         print(f"   • JSON: {self.residential_dir}/data.json")
         print(f"   • CSV: {self.residential_dir}/data.csv")
         print(f"   • Metadata: {self.residential_dir}/metadata.json")
-        print(f"   • Individual products: {self.data_dir}/[brand]/[product].json")
+        print(f"   • Brand products: {self.data_dir}/[brand]/products.json")
         
         print(f"\n🔄 Data freshness: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         print("✅ 100% real-time data - no outdated repositories!")
@@ -638,13 +859,18 @@ class LukePriorStyleTracker:
 
 def main():
     """Main function"""
-    tracker = LukePriorStyleTracker()
+    parser = argparse.ArgumentParser(description='Luke Prior Style Real-Time CDR Tracker')
+    parser.add_argument('--low-memory', action='store_true',
+                        help=f'Spool products to disk every {FLUSH_BATCH_SIZE} instead of holding the whole run in memory')
+    args = parser.parse_args()
+    
+    tracker = LukePriorStyleTracker(low_memory=args.low_memory)
     
     try:
-        products = tracker.run_luke_prior_tracker()
+        tracker.run_luke_prior_tracker()
         
         print(f"\n🎯 SUCCESS: Luke Prior style tracker completed!")
-        print(f"🚀 {len(products)} real-time mortgage products collected")
+        print(f"🚀 {tracker.product_count} real-time mortgage products collected")
         print(f"📊 Data available in Luke Prior compatible format")
         print(f"🔧 Maintainable and independent system")
         
@@ -8,6 +8,8 @@ Combines real-time API calls with fallback mechanisms and proper data enrichment
 
 import json
 import csv
+import functools
+import re
 import time
 import requests
 from datetime import datetime, timedelta
@@ -15,10 +17,24 @@ from typing import List, Dict, Any, Optional, Union
 from dataclasses import dataclass, asdict
 import logging
 import concurrent.futures
+import os
+from itertools import islice
 from pathlib import Path
 import schedule
 import argparse
 
+# orjson parses and encodes straight from/to bytes much faster; fall back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional incremental parser for the large aggregated feed
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +42,30 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Aim for about four chunks per worker process so the pool stays balanced
+# without paying the pickling cost of shipping products one at a time
+CHUNKS_PER_WORKER = 4
+
+# Percentage figures quoted in product names/descriptions, e.g. "5.99%"
+RATE_TEXT_PATTERN = re.compile(r'(\d+\.\d+)%')
+
+# Lower-case text keywords for each feature, in features_summary order
+FEATURE_KEYWORDS = {
+    'offset': ['offset', 'offset account'],
+    'redraw': ['redraw', 'redraw facility'],
+    'extra_repayments': ['extra repayment', 'additional repayment', 'early repayment'],
+    'split_loan': ['split', 'split loan', 'portion'],
+    'construction': ['construction', 'building loan', 'building finance'],
+    'interest_only': ['interest only', 'interest-only', 'i/o']
+}
+
+# One pass over the text finds every feature: a named group per feature,
+# inside a lookahead so keywords that overlap one another are all seen
+FEATURE_KEYWORD_PATTERN = re.compile('(?=' + '|'.join(
+    f"(?P<{feature_key}>{'|'.join(map(re.escape, keywords))})"
+    for feature_key, keywords in FEATURE_KEYWORDS.items()
+) + ')')
+
 @dataclass
 class MonthlyMortgageProduct:
     """Monthly mortgage product with complete data structure"""
@@ -93,6 +133,259 @@ class MonthlyMortgageProduct:
     last_updated: str
     next_review_date: str
 
+def enhance_product_data(product: Dict[str, Any]) -> MonthlyMortgageProduct:
+    """Enhance raw product data into structured format"""
+    source = product.get('_source', '')
+    source_name = product.get('_source_name', '')
+    
+    # Basic product information
+    product_id = product.get('productId', '')
+    product_name = product.get('name', '') or product.get('productName', '')
+    brand_name = product.get('brandName', source_name)
+    
+    # Extract rates intelligently
+    rates = extract_enhanced_rates(product)
+    
+    # Extract features intelligently  
+    features = extract_enhanced_features(product)
+    
+    # Extract loan characteristics
+    loan_chars = extract_loan_characteristics(product)
+    
+    # Calculate repayments
+    repayments = calculate_all_repayments(rates)
+    
+    # Extract fees (when available)
+    fees = extract_fee_information(product)
+    
+    return MonthlyMortgageProduct(
+        data_source=source,
+        bank_name=brand_name,
+        brand_id=product.get('brandId', ''),
+        product_id=product_id,
+        collection_date=datetime.now().strftime('%Y-%m-%d'),
+        data_version='1.0',
+        product_name=product_name,
+        product_category=product.get('productCategory', ''),
+        product_sub_category=product.get('productSubCategory', ''),
+        description=product.get('description', ''),
+        variable_rate=rates.get('variable'),
+        fixed_rate_1yr=rates.get('fixed_1yr'),
+        fixed_rate_2yr=rates.get('fixed_2yr'),
+        fixed_rate_3yr=rates.get('fixed_3yr'),
+        fixed_rate_4yr=rates.get('fixed_4yr'),
+        fixed_rate_5yr=rates.get('fixed_5yr'),
+        comparison_rate=rates.get('comparison'),
+        rate_notes=rates.get('notes', ''),
+        loan_purpose=loan_chars.get('purpose', 'Both'),
+        repayment_type=loan_chars.get('repayment_type', 'Principal and Interest'),
+        minimum_loan_amount=loan_chars.get('min_amount'),
+        maximum_loan_amount=loan_chars.get('max_amount'),
+        offset_available=features.get('offset', False),
+        redraw_available=features.get('redraw', False),
+        extra_repayments_allowed=features.get('extra_repayments', False),
+        split_loan_available=features.get('split_loan', False),
+        construction_loan_available=features.get('construction', False),
+        interest_only_available=features.get('interest_only', False),
+        features_summary=features.get('summary', ''),
+        application_fee=fees.get('application'),
+        annual_fee=fees.get('annual'),
+        monthly_service_fee=fees.get('monthly'),
+        exit_fee=fees.get('exit'),
+        valuation_fee=fees.get('valuation'),
+        settlement_fee=fees.get('settlement'),
+        other_fees_summary=fees.get('other_summary', ''),
+        monthly_repayment_300k=repayments.get('300k'),
+        monthly_repayment_500k=repayments.get('500k'),
+        monthly_repayment_750k=repayments.get('750k'),
+        monthly_repayment_1m=repayments.get('1m'),
+        application_url=product.get('applicationUri', ''),
+        information_url=product.get('additionalInformationUri', ''),
+        contact_phone='',
+        effective_from=product.get('effectiveFrom', ''),
+        last_updated=product.get('lastUpdated', ''),
+        next_review_date=''
+    )
+
+def extract_enhanced_rates(product: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """Extract rates with intelligent fallback"""
+    rates = {
+        'variable': None,
+        'fixed_1yr': None,
+        'fixed_2yr': None,
+        'fixed_3yr': None,
+        'fixed_4yr': None,
+        'fixed_5yr': None,
+        'comparison': None,
+        'notes': ''
+    }
+    
+    # Check if this is aggregated data format (from open banking tracker)
+    if 'rate' in product and isinstance(product['rate'], list):
+        for rate in product['rate']:
+            rate_type = rate.get('lendingRateType', '').upper()
+            rate_value = rate.get('rate', 0)
+            period = rate.get('period', 0)
+            
+            if rate_value and isinstance(rate_value, (int, float)):
+                if rate_type == 'VARIABLE':
+                    rates['variable'] = float(rate_value)
+                elif rate_type == 'FIXED':
+                    if period == 12:
+                        rates['fixed_1yr'] = float(rate_value)
+                    elif period == 24:
+                        rates['fixed_2yr'] = float(rate_value)
+                    elif period == 36:
+                        rates['fixed_3yr'] = float(rate_value)
+                    elif period == 48:
+                        rates['fixed_4yr'] = float(rate_value)
+                    elif period == 60:
+                        rates['fixed_5yr'] = float(rate_value)
+    
+    # If no rates found, try to extract from text
+    if not any(rates.values()):
+        text = f"{product.get('name', '')} {product.get('description', '')}".lower()
+        found_rates = RATE_TEXT_PATTERN.findall(text)
+        
+        if found_rates:
+            # Assign first found rate as variable (common case)
+            rates['variable'] = float(found_rates[0])
+            rates['notes'] = f"Extracted from product text: {found_rates[0]}%"
+    
+    return rates
+
+def extract_enhanced_features(product: Dict[str, Any]) -> Dict[str, Union[bool, str]]:
+    """Extract features with intelligent detection"""
+    features = {
+        'offset': False,
+        'redraw': False,
+        'extra_repayments': False,
+        'split_loan': False,
+        'construction': False,
+        'interest_only': False,
+        'summary': ''
+    }
+    
+    # Check direct fields (aggregated data format)
+    if 'offset' in product:
+        features['offset'] = product['offset'] is True
+    
+    if 'redraw' in product:
+        features['redraw'] = product['redraw'] is True
+    
+    # Text-based feature detection
+    text_content = ' '.join([
+        product.get('name', ''),
+        product.get('description', ''),
+        product.get('productName', '')
+    ]).lower()
+    
+    found = {match.lastgroup for match in FEATURE_KEYWORD_PATTERN.finditer(text_content)}
+    
+    feature_list = []
+    for feature_key in FEATURE_KEYWORDS:
+        if feature_key in found:
+            features[feature_key] = True
+            feature_list.append(feature_key.replace('_', ' ').title())
+    
+    features['summary'] = ' | '.join(feature_list) if feature_list else ''
+    
+    return features
+
+def extract_loan_characteristics(product: Dict[str, Any]) -> Dict[str, Any]:
+    """Extract loan purpose and repayment characteristics"""
+    characteristics = {
+        'purpose': 'Both',
+        'repayment_type': 'Principal and Interest',
+        'min_amount': None,
+        'max_amount': None
+    }
+    
+    # Check aggregated data format
+    if 'rate' in product and isinstance(product['rate'], list):
+        purposes = set()
+        repayment_types = set()
+        
+        for rate in product['rate']:
+            purpose = rate.get('purpose', '').upper()
+            repayment_type = rate.get('repaymentType', '').upper()
+            
+            if purpose:
+                purposes.add(purpose)
+            if repayment_type:
+                repayment_types.add(repayment_type)
+        
+        # Map purposes
+        if len(purposes) == 1:
+            purpose = list(purposes)[0]
+            if purpose == 'INVESTMENT':
+                characteristics['purpose'] = 'Investment'
+            elif purpose == 'OWNER_OCCUPIED':
+                characteristics['purpose'] = 'Owner Occupier'
+        elif 'INVESTMENT' in purposes and 'OWNER_OCCUPIED' in purposes:
+            characteristics['purpose'] = 'Both'
+        
+        # Map repayment types
+        if len(repayment_types) == 1:
+            rep_type = list(repayment_types)[0]
+            if rep_type == 'PRINCIPAL_AND_INTEREST':
+                characteristics['repayment_type'] = 'Principal and Interest'
+            elif rep_type == 'INTEREST_ONLY':
+                characteristics['repayment_type'] = 'Interest Only'
+        elif 'PRINCIPAL_AND_INTEREST' in repayment_types and 'INTEREST_ONLY' in repayment_types:
+            characteristics['repayment_type'] = 'Both'
+    
+    return characteristics
+
+def extract_fee_information(product: Dict[str, Any]) -> Dict[str, Optional[float]]:
+    """Extract fee information when available"""
+    fees = {
+        'application': None,
+        'annual': None,
+        'monthly': None,
+        'exit': None,
+        'valuation': None,
+        'settlement': None,
+        'other_summary': ''
+    }
+    
+    # For now, return empty fees as detailed fee data requires separate API calls
+    # This would be enhanced in a production version
+    
+    return fees
+
+# Loan amounts quoted in the repayment fields, in field order
+LOAN_AMOUNTS = (300000, 500000, 750000, 1000000)
+
+@functools.lru_cache(maxsize=4096)
+def repayments_for_rate(rate: float) -> tuple:
+    """30-year monthly repayments on each of LOAN_AMOUNTS at an annual rate"""
+    monthly_rate = rate / 12
+    n_payments = 30 * 12  # 30 years
+    growth = (1 + monthly_rate)**n_payments
+    return tuple(round(amount * (monthly_rate * growth) / (growth - 1), 2) for amount in LOAN_AMOUNTS)
+
+def calculate_all_repayments(rates: Dict[str, Optional[float]]) -> Dict[str, Optional[float]]:
+    """Calculate monthly repayments for different loan amounts"""
+    amount_keys = ['300k', '500k', '750k', '1m']
+    
+    # Use the best available rate
+    rate = rates.get('variable') or rates.get('fixed_3yr') or rates.get('fixed_2yr') or rates.get('fixed_1yr')
+    
+    if rate and rate > 0:
+        return dict(zip(amount_keys, repayments_for_rate(rate)))
+    return dict.fromkeys(amount_keys)
+
+def enhance_product_chunk(products: List[Dict[str, Any]]) -> List[MonthlyMortgageProduct]:
+    """Enhance a chunk of raw products, skipping any that fail"""
+    enhanced_products = []
+    for raw_product in products:
+        try:
+            enhanced_products.append(enhance_product_data(raw_product))
+        except Exception as e:
+            logger.warning(f"Error enhancing product {raw_product.get('productId', 'unknown')}: {e}")
+    return enhanced_products
+
 class MonthlyMortgagePipeline:
     """Production-ready monthly mortgage data pipeline"""
     
@@ -163,7 +456,7 @@ class MonthlyMortgagePipeline:
             )
             
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content) if orjson else response.json()
                 products = data.get('data', {}).get('products', [])
                 
                 # Filter for residential mortgages
@@ -188,7 +481,7 @@ class MonthlyMortgagePipeline:
                 response = self.session.get(source_config['endpoint'], headers=headers_no_version, timeout=30)
                 
                 if response.status_code == 200:
-                    data = response.json()
+                    data = orjson.loads(response.content) if orjson else response.json()
                     products = data.get('data', {}).get('products', [])
                     logger.info(f"✅ {source_config['name']}: {len(products)} products (fallback)")
                     return products
@@ -209,24 +502,30 @@ class MonthlyMortgagePipeline:
         try:
             logger.info(f"📊 Collecting from {source_config['name']}...")
             
-            response = self.session.get(source_config['endpoint'], timeout=60)
+            with self.session.get(source_config['endpoint'], timeout=60, stream=True) as response:
+                if response.status_code == 200:
+                    if ijson:
+                        # Parse products one at a time as the feed downloads,
+                        # instead of buffering the whole body first
+                        response.raw.decode_content = True
+                        feed = ijson.items(response.raw, 'item', use_float=True)
+                    else:
+                        feed = orjson.loads(response.content) if orjson else response.json()
+                    
+                    # Add source information
+                    products = []
+                    for product in feed:
+                        product['_source'] = source_key
+                        product['_source_name'] = source_config['name']
+                        products.append(product)
+                    
+                    logger.info(f"✅ {source_config['name']}: {len(products)} products")
+                    return products
             
-            if response.status_code == 200:
-                products = response.json()
-                
-                # Add source information
-                for product in products:
-                    product['_source'] = source_key
-                    product['_source_name'] = source_config['name']
-                
-                logger.info(f"✅ {source_config['name']}: {len(products)} products")
-                return products
-                
-            else:
-                error_msg = f"{source_config['name']}: HTTP {response.status_code}"
-                logger.warning(error_msg)
-                self.collection_errors.append(error_msg)
-                return []
+            error_msg = f"{source_config['name']}: HTTP {response.status_code}"
+            logger.warning(error_msg)
+            self.collection_errors.append(error_msg)
+            return []
                 
         except Exception as e:
             error_msg = f"{source_config['name']}: {str(e)}"
@@ -234,304 +533,72 @@ class MonthlyMortgagePipeline:
             self.collection_errors.append(error_msg)
             return []
     
-    def enhance_product_data(self, product: Dict[str, Any]) -> MonthlyMortgageProduct:
-        """Enhance raw product data into structured format"""
-        source = product.get('_source', '')
-        source_name = product.get('_source_name', '')
-        
-        # Basic product information
-        product_id = product.get('productId', '')
-        product_name = product.get('name', '') or product.get('productName', '')
-        brand_name = product.get('brandName', source_name)
-        
-        # Extract rates intelligently
-        rates = self.extract_enhanced_rates(product)
-        
-        # Extract features intelligently  
-        features = self.extract_enhanced_features(product)
-        
-        # Extract loan characteristics
-        loan_chars = self.extract_loan_characteristics(product)
-        
-        # Calculate repayments
-        repayments = self.calculate_all_repayments(rates)
-        
-        # Extract fees (when available)
-        fees = self.extract_fee_information(product)
-        
-        return MonthlyMortgageProduct(
-            data_source=source,
-            bank_name=brand_name,
-            brand_id=product.get('brandId', ''),
-            product_id=product_id,
-            collection_date=datetime.now().strftime('%Y-%m-%d'),
-            data_version='1.0',
-            product_name=product_name,
-            product_category=product.get('productCategory', ''),
-            product_sub_category=product.get('productSubCategory', ''),
-            description=product.get('description', ''),
-            variable_rate=rates.get('variable'),
-            fixed_rate_1yr=rates.get('fixed_1yr'),
-            fixed_rate_2yr=rates.get('fixed_2yr'),
-            fixed_rate_3yr=rates.get('fixed_3yr'),
-            fixed_rate_4yr=rates.get('fixed_4yr'),
-            fixed_rate_5yr=rates.get('fixed_5yr'),
-            comparison_rate=rates.get('comparison'),
-            rate_notes=rates.get('notes', ''),
-            loan_purpose=loan_chars.get('purpose', 'Both'),
-            repayment_type=loan_chars.get('repayment_type', 'Principal and Interest'),
-            minimum_loan_amount=loan_chars.get('min_amount'),
-            maximum_loan_amount=loan_chars.get('max_amount'),
-            offset_available=features.get('offset', False),
-            redraw_available=features.get('redraw', False),
-            extra_repayments_allowed=features.get('extra_repayments', False),
-            split_loan_available=features.get('split_loan', False),
-            construction_loan_available=features.get('construction', False),
-            interest_only_available=features.get('interest_only', False),
-            features_summary=features.get('summary', ''),
-            application_fee=fees.get('application'),
-            annual_fee=fees.get('annual'),
-            monthly_service_fee=fees.get('monthly'),
-            exit_fee=fees.get('exit'),
-            valuation_fee=fees.get('valuation'),
-            settlement_fee=fees.get('settlement'),
-            other_fees_summary=fees.get('other_summary', ''),
-            monthly_repayment_300k=repayments.get('300k'),
-            monthly_repayment_500k=repayments.get('500k'),
-            monthly_repayment_750k=repayments.get('750k'),
-            monthly_repayment_1m=repayments.get('1m'),
-            application_url=product.get('applicationUri', ''),
-            information_url=product.get('additionalInformationUri', ''),
-            contact_phone='',
-            effective_from=product.get('effectiveFrom', ''),
-            last_updated=product.get('lastUpdated', ''),
-            next_review_date=''
-        )
-    
-    def extract_enhanced_rates(self, product: Dict[str, Any]) -> Dict[str, Optional[float]]:
-        """Extract rates with intelligent fallback"""
-        rates = {
-            'variable': None,
-            'fixed_1yr': None,
-            'fixed_2yr': None,
-            'fixed_3yr': None,
-            'fixed_4yr': None,
-            'fixed_5yr': None,
-            'comparison': None,
-            'notes': ''
-        }
-        
-        # Check if this is aggregated data format (from open banking tracker)
-        if 'rate' in product and isinstance(product['rate'], list):
-            for rate in product['rate']:
-                rate_type = rate.get('lendingRateType', '').upper()
-                rate_value = rate.get('rate', 0)
-                period = rate.get('period', 0)
-                
-                if rate_value and isinstance(rate_value, (int, float)):
-                    if rate_type == 'VARIABLE':
-                        rates['variable'] = float(rate_value)
-                    elif rate_type == 'FIXED':
-                        if period == 12:
-                            rates['fixed_1yr'] = float(rate_value)
-                        elif period == 24:
-                            rates['fixed_2yr'] = float(rate_value)
-                        elif period == 36:
-                            rates['fixed_3yr'] = float(rate_value)
-                        elif period == 48:
-                            rates['fixed_4yr'] = float(rate_value)
-                        elif period == 60:
-                            rates['fixed_5yr'] = float(rate_value)
-        
-        # If no rates found, try to extract from text
-        if not any(rates.values()):
-            text = f"{product.get('name', '')} {product.get('description', '')}".lower()
-            rate_pattern = r'(\d+\.\d+)%'
-            import re
-            found_rates = re.findall(rate_pattern, text)
-            
-            if found_rates:
-                # Assign first found rate as variable (common case)
-                rates['variable'] = float(found_rates[0])
-                rates['notes'] = f"Extracted from product text: {found_rates[0]}%"
-        
-        return rates
-    
-    def extract_enhanced_features(self, product: Dict[str, Any]) -> Dict[str, Union[bool, str]]:
-        """Extract features with intelligent detection"""
-        features = {
-            'offset': False,
-            'redraw': False,
-            'extra_repayments': False,
-            'split_loan': False,
-            'construction': False,
-            'interest_only': False,
-            'summary': ''
-        }
-        
-        # Check direct fields (aggregated data format)
-        if 'offset' in product:
-            features['offset'] = product['offset'] is True
-        
-        if 'redraw' in product:
-            features['redraw'] = product['redraw'] is True
-        
-        # Text-based feature detection
-        text_content = ' '.join([
-            product.get('name', ''),
-            product.get('description', ''),
-            product.get('productName', '')
-        ]).lower()
-        
-        feature_keywords = {
-            'offset': ['offset', 'offset account'],
-            'redraw': ['redraw', 'redraw facility'],
-            'extra_repayments': ['extra repayment', 'additional repayment', 'early repayment'],
-            'split_loan': ['split', 'split loan', 'portion'],
-            'construction': ['construction', 'building loan', 'building finance'],
-            'interest_only': ['interest only', 'interest-only', 'i/o']
-        }
-        
-        feature_list = []
-        for feature_key, keywords in feature_keywords.items():
-            if any(keyword in text_content for keyword in keywords):
-                features[feature_key] = True
-                feature_list.append(feature_key.replace('_', ' ').title())
-        
-        features['summary'] = ' | '.join(feature_list) if feature_list else ''
-        
-        return features
-    
-    def extract_loan_characteristics(self, product: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract loan purpose and repayment characteristics"""
-        characteristics = {
-            'purpose': 'Both',
-            'repayment_type': 'Principal and Interest',
-            'min_amount': None,
-            'max_amount': None
-        }
-        
-        # Check aggregated data format
-        if 'rate' in product and isinstance(product['rate'], list):
-            purposes = set()
-            repayment_types = set()
-            
-            for rate in product['rate']:
-                purpose = rate.get('purpose', '').upper()
-                repayment_type = rate.get('repaymentType', '').upper()
-                
-                if purpose:
-                    purposes.add(purpose)
-                if repayment_type:
-                    repayment_types.add(repayment_type)
-            
-            # Map purposes
-            if len(purposes) == 1:
-                purpose = list(purposes)[0]
-                if purpose == 'INVESTMENT':
-                    characteristics['purpose'] = 'Investment'
-                elif purpose == 'OWNER_OCCUPIED':
-                    characteristics['purpose'] = 'Owner Occupier'
-            elif 'INVESTMENT' in purposes and 'OWNER_OCCUPIED' in purposes:
-                characteristics['purpose'] = 'Both'
-            
-            # Map repayment types
-            if len(repayment_types) == 1:
-                rep_type = list(repayment_types)[0]
-                if rep_type == 'PRINCIPAL_AND_INTEREST':
-                    characteristics['repayment_type'] = 'Principal and Interest'
-                elif rep_type == 'INTEREST_ONLY':
-                    characteristics['repayment_type'] = 'Interest Only'
-            elif 'PRINCIPAL_AND_INTEREST' in repayment_types and 'INTEREST_ONLY' in repayment_types:
-                characteristics['repayment_type'] = 'Both'
-        
-        return characteristics
-    
-    def extract_fee_information(self, product: Dict[str, Any]) -> Dict[str, Optional[float]]:
-        """Extract fee information when available"""
-        fees = {
-            'application': None,
-            'annual': None,
-            'monthly': None,
-            'exit': None,
-            'valuation': None,
-            'settlement': None,
-            'other_summary': ''
-        }
+    def enhance_products_parallel(self, products: List[Dict[str, Any]]) -> List[MonthlyMortgageProduct]:
+        """Enhance products in chunks across a pool of worker processes"""
+        chunk_size = max(1, len(products) // (CHUNKS_PER_WORKER * (os.cpu_count() or 1)))
+        remaining = iter(products)
+        chunks = iter(lambda: list(islice(remaining, chunk_size)), [])
+        enhanced_products = []
         
-        # For now, return empty fees as detailed fee data requires separate API calls
-        # This would be enhanced in a production version
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            for chunk_products in executor.map(enhance_product_chunk, chunks):
+                enhanced_products.extend(chunk_products)
         
-        return fees
+        return enhanced_products
     
-    def calculate_all_repayments(self, rates: Dict[str, Optional[float]]) -> Dict[str, Optional[float]]:
-        """Calculate monthly repayments for different loan amounts"""
-        repayments = {
-            '300k': None,
-            '500k': None,
-            '750k': None,
-            '1m': None
-        }
-        
-        # Use the best available rate
-        rate = rates.get('variable') or rates.get('fixed_3yr') or rates.get('fixed_2yr') or rates.get('fixed_1yr')
-        
-        if rate and rate > 0:
-            monthly_rate = rate / 12
-            n_payments = 30 * 12  # 30 years
-            
-            loan_amounts = [300000, 500000, 750000, 1000000]
-            amount_keys = ['300k', '500k', '750k', '1m']
-            
-            for amount, key in zip(loan_amounts, amount_keys):
-                if monthly_rate > 0:
-                    payment = amount * (monthly_rate * (1 + monthly_rate)**n_payments) / ((1 + monthly_rate)**n_payments - 1)
-                    repayments[key] = round(payment, 2)
+    def run_monthly_collection(self, parallel: bool = False) -> List[MonthlyMortgageProduct]:
+        """Run the monthly data collection
         
-        return repayments
-    
-    def run_monthly_collection(self) -> List[MonthlyMortgageProduct]:
-        """Run the monthly data collection"""
+        With parallel=True products are enhanced on all CPU cores, which only
+        pays off for large aggregated feeds.
+        """
         logger.info("🚀 Starting Monthly Mortgage Data Collection")
         logger.info("=" * 55)
         
         start_time = datetime.now()
         all_raw_products = []
         
-        # Collect from all sources
-        for source_key, source_config in self.data_sources.items():
-            if not source_config.get('active', True):
-                continue
-                
-            try:
-                if source_config['type'] == 'api':
-                    products = self.fetch_from_api_source(source_key, source_config)
-                elif source_config['type'] == 'aggregated':
-                    products = self.fetch_from_aggregated_source(source_key, source_config)
-                else:
-                    continue
-                
+        # Collect from all sources at once - each is a different host, so
+        # there is only ever one request in flight per bank
+        fetchers = {
+            'api': self.fetch_from_api_source,
+            'aggregated': self.fetch_from_aggregated_source,
+        }
+        active_sources = [
+            (source_key, source_config) for source_key, source_config in self.data_sources.items()
+            if source_config.get('active', True) and source_config.get('type') in fetchers
+        ]
+        
+        source_products = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, len(active_sources))) as executor:
+            future_to_source = {
+                executor.submit(fetchers[source_config['type']], source_key, source_config): source_key
+                for source_key, source_config in active_sources
+            }
+            
+            for future in concurrent.futures.as_completed(future_to_source):
+                source_key = future_to_source[future]
+                try:
+                    source_products[source_key] = future.result()
+                except Exception as e:
+                    error_msg = f"Failed to collect from {source_key}: {e}"
+                    logger.error(error_msg)
+                    self.collection_errors.append(error_msg)
+        
+        # Keep the configured source order in the output, whatever order responses arrived in
+        for source_key, _ in active_sources:
+            if source_key in source_products:
+                products = source_products[source_key]
                 all_raw_products.extend(products)
                 self.collection_stats[source_key] = len(products)
-                
-                # Rate limiting
-                time.sleep(2)
-                
-            except Exception as e:
-                error_msg = f"Failed to collect from {source_key}: {e}"
-                logger.error(error_msg)
-                self.collection_errors.append(error_msg)
         
         # Process and enhance all products
         logger.info(f"📊 Processing {len(all_raw_products)} raw products...")
         
-        enhanced_products = []
-        for raw_product in all_raw_products:
-            try:
-                enhanced_product = self.enhance_product_data(raw_product)
-                enhanced_products.append(enhanced_product)
-            except Exception as e:
-                logger.warning(f"Error enhancing product {raw_product.get('productId', 'unknown')}: {e}")
+        if parallel:
+            enhanced_products = self.enhance_products_parallel(all_raw_products)
+        else:
+            enhanced_products = enhance_product_chunk(all_raw_products)
         
         self.collected_products = enhanced_products
         
@@ -557,8 +624,12 @@ class MonthlyMortgagePipeline:
         
         # Save detailed JSON
         json_file = self.output_dir / f"monthly_mortgages_{timestamp}.json"
-        with open(json_file, 'w') as f:
-            json.dump([asdict(product) for product in self.collected_products], f, indent=2, default=str)
+        if orjson:
+            # orjson encodes the dataclasses natively, without an asdict copy of each
+            json_file.write_bytes(orjson.dumps(self.collected_products, option=orjson.OPT_INDENT_2, default=str))
+        else:
+            with open(json_file, 'w') as f:
+                json.dump([asdict(product) for product in self.collected_products], f, indent=2, default=str)
         files_created['json'] = str(json_file)
         
         # Save collection report
@@ -684,11 +755,11 @@ class MonthlyMortgagePipeline:
         print(f"\n🔄 Next collection: Schedule monthly for fresh data")
         print("✅ Independent of outdated repositories!")
 
-def schedule_monthly_runs():
+def schedule_monthly_runs(parallel: bool = False):
     """Schedule monthly data collection"""
     def run_collection():
         pipeline = MonthlyMortgagePipeline()
-        pipeline.run_monthly_collection()
+        pipeline.run_monthly_collection(parallel=parallel)
     
     # Schedule for the 1st of every month at 2 AM
     schedule.every().month.at("02:00").do(run_collection)
@@ -704,16 +775,17 @@ def main():
     parser = argparse.ArgumentParser(description='Monthly Mortgage Data Pipeline')
     parser.add_argument('--run-now', action='store_true', help='Run collection immediately')
     parser.add_argument('--schedule', action='store_true', help='Start scheduled monthly collection')
+    parser.add_argument('--parallel', action='store_true', help='Enhance products across all CPU cores')
     
     args = parser.parse_args()
     
     if args.schedule:
         print("📅 Starting scheduled monthly collection...")
-        schedule_monthly_runs()
+        schedule_monthly_runs(parallel=args.parallel)
     else:
         # Default: run now
         pipeline = MonthlyMortgagePipeline()
-        products = pipeline.run_monthly_collection()
+        products = pipeline.run_monthly_collection(parallel=args.parallel)
         
         print(f"\n🎯 SUCCESS: Monthly mortgage collection completed!")
         print(f"📈 {len(products)} products collected with fresh, real-time data")